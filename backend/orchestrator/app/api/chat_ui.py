@@ -16,7 +16,7 @@ from ..config import get_settings, Settings
 from .model_standardization import ModelParser, ModelValidator, ModelProvider
 from ..db.database import get_db
 from ..db.models import Conversation, Message, PromptProfile, ChatMetric
-from ..services.chat_router import ChatRouter
+from ..services.chat_router import get_chat_router
 from .error_handling import (
     ErrorCode, ErrorResponse, create_error_response,
     handle_conversation_not_found_error, handle_internal_server_error,
@@ -175,67 +175,63 @@ async def send_message(
         db.commit()
         
         # Route message
-        router_service = ChatRouter(settings)
-        try:
-            import time
-            start_time = time.time()
-            
-            # Standardize model ID before routing
-            standardized_model_id = None
-            if request.model_id or conversation.model_id:
-                try:
-                    raw_model = request.model_id or conversation.model_id
-                    standardized_model_id = ModelParser.standardize(raw_model, use_full=True)
-                except Exception:
-                    standardized_model_id = request.model_id or conversation.model_id
+        router_service = get_chat_router(settings)
+        import time
+        start_time = time.time()
+        
+        # Standardize model ID before routing
+        standardized_model_id = None
+        if request.model_id or conversation.model_id:
+            try:
+                raw_model = request.model_id or conversation.model_id
+                standardized_model_id = ModelParser.standardize(raw_model, use_full=True)
+            except Exception:
+                standardized_model_id = request.model_id or conversation.model_id
 
-            result = await router_service.route_message(
-                message=request.message,
-                conversation_id=conversation.id,
-                model_id=standardized_model_id,
-                routing_profile=request.routing_profile,
-                use_memory=request.use_memory,
-                use_tools=request.use_tools,
-                user_id=conversation.user_id,
-                metadata=request.metadata
-            )
-            
-            processing_time_ms = (time.time() - start_time) * 1000
-            
-            # Store assistant message
-            assistant_message = Message(
-                conversation_id=conversation.id,
-                role="assistant",
-                content=result.get("answer", ""),
-                metadata=result.get("metadata", {})
-            )
-            db.add(assistant_message)
-            
-            # Update conversation
-            conversation.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(assistant_message)
-            
-            # Build standardized response metadata
-            response_metadata = ResponseMetadata(
-                processing_time_ms=processing_time_ms,
-                tokens_used=result.get("tokens_used"),
-                model_id=standardized_model_id,
-                routing_profile=request.routing_profile,
-                conversation_id=conversation.id,
-                message_id=assistant_message.id
-            )
-            
-            return SendMessageResponse(
-                conversation_id=conversation.id,
-                message_id=assistant_message.id,
-                answer=result.get("answer", ""),
-                metadata=response_metadata,
-                error=result.get("error")
-            )
-            
-        finally:
-            await router_service.close()
+        result = await router_service.route_message(
+            message=request.message,
+            conversation_id=conversation.id,
+            model_id=standardized_model_id,
+            routing_profile=request.routing_profile,
+            use_memory=request.use_memory,
+            use_tools=request.use_tools,
+            user_id=conversation.user_id,
+            metadata=request.metadata
+        )
+        
+        processing_time_ms = (time.time() - start_time) * 1000
+        
+        # Store assistant message
+        assistant_message = Message(
+            conversation_id=conversation.id,
+            role="assistant",
+            content=result.get("answer", ""),
+            metadata=result.get("metadata", {})
+        )
+        db.add(assistant_message)
+        
+        # Update conversation
+        conversation.updated_at = datetime.utcnow()
+        db.commit()
+        db.refresh(assistant_message)
+        
+        # Build standardized response metadata
+        response_metadata = ResponseMetadata(
+            processing_time_ms=processing_time_ms,
+            tokens_used=result.get("tokens_used"),
+            model_id=standardized_model_id,
+            routing_profile=request.routing_profile,
+            conversation_id=conversation.id,
+            message_id=assistant_message.id
+        )
+        
+        return SendMessageResponse(
+            conversation_id=conversation.id,
+            message_id=assistant_message.id,
+            answer=result.get("answer", ""),
+            metadata=response_metadata,
+            error=result.get("error")
+        )
             
     except HTTPExceptionWithErrorCode:
         raise
@@ -321,51 +317,48 @@ async def send_message_stream(
         db.commit()
         
         # Stream response
-        router_service = ChatRouter(settings)
+        router_service = get_chat_router(settings)
         
         async def generate():
-            full_response = ""
-            try:
-                # Standardize model ID before streaming
-                standardized_model_id = None
-                if model_id_to_use:
-                    try:
-                        standardized_model_id = ModelParser.standardize(model_id_to_use, use_full=True)
-                    except Exception:
-                        standardized_model_id = model_id_to_use
-
-                # Stream tokens from router and emit SSE frames
-                async for chunk in router_service.stream_message(
-                    message=request.message,
-                    conversation_id=conversation_id,
-                    model_id=standardized_model_id,
-                    connection_id=request.connection_id,
-                    routing_profile=request.routing_profile,
-                    use_memory=request.use_memory,
-                    user_id=user_id,
-                    metadata=request.metadata
-                ):
-                    # Normalize chunk to string
-                    token = chunk if isinstance(chunk, str) else chunk.get("token") or chunk.get("data") or ""
-                    if token:
-                        full_response += token
-                        yield f"data: {token}\n\n"
-                
-                # Save assistant message to database
-                assistant_message = Message(
-                    conversation_id=conversation_id,
-                    role="assistant",
-                    content=full_response,
-                    metadata={"model": standardized_model_id}
-                )
-                db.add(assistant_message)
-                db.commit()
-                
-                # Final event to signal completion
-                yield "event: done\n"
-                yield f"data: {{\"conversation_id\": \"{conversation_id}\", \"model_id\": \"{standardized_model_id}\"}}\n\n"
-            finally:
-                await router_service.close()
+            tokens: List[str] = []
+            # Standardize model ID before streaming
+            standardized_model_id = None
+            if model_id_to_use:
+                try:
+                    standardized_model_id = ModelParser.standardize(model_id_to_use, use_full=True)
+                except Exception:
+                    standardized_model_id = model_id_to_use
+
+            # Stream tokens from router and emit SSE frames
+            async for chunk in router_service.stream_message(
+                message=request.message,
+                conversation_id=conversation_id,
+                model_id=standardized_model_id,
+                connection_id=request.connection_id,
+                routing_profile=request.routing_profile,
+                use_memory=request.use_memory,
+                user_id=user_id,
+                metadata=request.metadata
+            ):
+                # Normalize chunk to string
+                token = chunk if isinstance(chunk, str) else chunk.get("token") or chunk.get("data") or ""
+                if token:
+                    tokens.append(token)
+                    yield f"data: {token}\n\n"
+            
+            # Save assistant message to database
+            assistant_message = Message(
+                conversation_id=conversation_id,
+                role="assistant",
+                content="".join(tokens),
+                metadata={"model": standardized_model_id}
+            )
+            db.add(assistant_message)
+            db.commit()
+            
+            # Final event to signal completion
+            yield "event: done\n"
+            yield f"data: {{\"conversation_id\": \"{conversation_id}\", \"model_id\": \"{standardized_model_id}\"}}\n\n"
         
         return StreamingResponse(generate(), media_type="text/event-stream")
         
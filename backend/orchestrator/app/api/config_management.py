@@ -256,10 +256,10 @@ async def update_env_config(
     """
     try:
         # Backup existing config
-        config_writer.backup_config(".env")
+        await config_writer.abackup_config(".env")
         
         # Write new config
-        success = config_writer.write_env_file(config.variables)
+        success = await config_writer.awrite_env_file(config.variables)
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to write .env file")
@@ -290,13 +290,13 @@ async def update_agents_config(
     """
     try:
         # Backup existing config
-        config_writer.backup_config("agents.json")
+        await config_writer.abackup_config("agents.json")
         
         # Convert to dict format
         agents_list = [agent.dict() for agent in agents]
         
         # Write new config
-        success = config_writer.write_agents_config(agents_list)
+        success = await config_writer.awrite_json_config("agents.json", {"agents": agents_list})
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to write agents.json")
@@ -327,13 +327,15 @@ async def update_datasources_config(
     """
     try:
         # Backup existing config
-        config_writer.backup_config("datasources.json")
+        await config_writer.abackup_config("datasources.json")
         
         # Convert to dict format
         datasources_list = [ds.dict() for ds in datasources]
         
         # Write new config
-        success = config_writer.write_datasources_config(datasources_list)
+        success = await config_writer.awrite_json_config(
+            "datasources.json", {"datasources": datasources_list}
+        )
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to write datasources.json")
@@ -364,13 +366,13 @@ async def update_tools_config(
     """
     try:
         # Backup existing config
-        config_writer.backup_config("tools.json")
+        await config_writer.abackup_config("tools.json")
         
         # Convert to dict format
         tools_list = [tool.dict() for tool in tools]
         
         # Write new config
-        success = config_writer.write_tools_config(tools_list)
+        success = await config_writer.awrite_json_config("tools.json", {"tools": tools_list})
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to write tools.json")
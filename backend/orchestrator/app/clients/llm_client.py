@@ -69,7 +69,10 @@ class LLMClient:
         # HTTP client for making requests
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(self.timeout),
-            headers=self._get_headers()
+            headers=self._get_headers(),
+            limits=httpx.Limits(
+                max_keepalive_connections=getattr(settings, "llm_max_keepalive_connections", 20)
+            )
         )
     
     def _detect_provider(self) -> LLMProvider:
@@ -0,0 +1,10 @@
+"""
+Python version compatibility helpers.
+
+Shared by modules that adapt to features of newer Python releases.
+"""
+
+import sys
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -84,6 +84,7 @@ class Settings(BaseSettings):
     app_version: str = Field(default="1.0.0", description="Application version")
     debug: bool = Field(default=False, description="Debug mode")
     log_level: str = Field(default="INFO", description="Logging level")
+    async_eager_tasks: bool = Field(default=True, description="Run new asyncio tasks eagerly (Python 3.12+)")
     
     # API Settings
     api_host: str = Field(default="0.0.0.0", description="API host")
@@ -99,6 +100,8 @@ class Settings(BaseSettings):
     llm_temperature: float = Field(default=0.7, description="Default temperature for LLM")
     llm_max_tokens: Optional[int] = Field(default=None, description="Maximum tokens for LLM response")
     llm_api_key: Optional[str] = Field(default=None, description="LLM API key")
+    llm_max_keepalive_connections: int = Field(default=20, description="Idle keep-alive connections kept per LLM client")
+    llm_max_concurrency: int = Field(default=32, description="Maximum concurrent chat requests per LLM connection")
     # Multiple LLM connections (GUI-driven)
     class LLMConnectionConfig(BaseModel):
         id: str = Field(..., description="Connection identifier")
@@ -141,6 +144,9 @@ class Settings(BaseSettings):
     redis_db: int = Field(default=0, description="Redis database number")
     redis_url: Optional[str] = Field(default=None, description="Redis URL (overrides individual fields)")
     redis_ttl_seconds: int = Field(default=3600, description="Default Redis TTL in seconds")
+    redis_pool_size: int = Field(default=32, description="Maximum connections in the Redis connection pool")
+    redis_scan_count: int = Field(default=1000, description="COUNT hint for Redis SCAN iterations")
+    state_memory_fallback_max: int = Field(default=10000, description="Maximum states kept in memory when Redis is unavailable")
     
     # Vector Database Configuration
     vector_db_type: str = Field(default="chroma", description="Vector DB type (chroma, pinecone, weaviate, etc.)")
@@ -157,6 +163,8 @@ class Settings(BaseSettings):
     # Cache Configuration
     cache_enabled: bool = Field(default=True, description="Enable response caching")
     cache_ttl_seconds: int = Field(default=3600, description="Cache TTL in seconds")
+    chat_response_cache_size: int = Field(default=1024, description="Max cached direct-LLM chat responses (0 disables)")
+    chat_response_cache_ttl_seconds: int = Field(default=300, description="TTL for cached direct-LLM chat responses")
     
     # Multi-Agent Configuration
     external_agents: Dict[str, ExternalAgentConfig] = Field(
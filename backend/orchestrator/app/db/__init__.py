@@ -4,12 +4,13 @@ Database package for exampleOne Orchestrator Studio.
 Provides database models and connection management.
 """
 
-from .database import get_db, init_db, engine, SessionLocal
+from .database import get_db, init_db, create_missing_tables, engine, SessionLocal
 from .models import Credential, Base
 
 __all__ = [
     "get_db",
     "init_db",
+    "create_missing_tables",
     "engine",
     "SessionLocal",
     "Credential",
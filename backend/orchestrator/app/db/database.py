@@ -5,8 +5,12 @@ Provides SQLAlchemy engine and session factory for credential storage.
 """
 
 import logging
-from typing import Generator
-from sqlalchemy import create_engine
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Generator, List
+import orjson
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
@@ -14,6 +18,12 @@ from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON columns with orjson; non-str keys are allowed as with json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Get database URL from settings
 settings = get_settings()
 DATABASE_URL = settings.get_postgres_dsn()
@@ -26,7 +36,9 @@ if not DATABASE_URL:
     engine = create_engine(
         DATABASE_URL,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool
+        poolclass=StaticPool,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads
     )
 else:
     # PostgreSQL configuration
@@ -34,12 +46,31 @@ else:
         DATABASE_URL,
         pool_pre_ping=True,
         pool_size=5,
-        max_overflow=10
+        max_overflow=10,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads
     )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for writes on the request path (PostgreSQL via asyncpg only)
+async_engine = None
+AsyncSessionLocal = None
+if DATABASE_URL.startswith("postgresql"):
+    try:
+        async_engine = create_async_engine(
+            make_url(DATABASE_URL).set(drivername="postgresql+asyncpg"),
+            pool_pre_ping=True,
+            pool_size=5,
+            max_overflow=10,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads
+        )
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+    except ImportError:
+        logger.warning("asyncpg not installed, async database sessions unavailable")
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -61,6 +92,60 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+@asynccontextmanager
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Get an async database session.
+    
+    Only available with PostgreSQL and asyncpg; check AsyncSessionLocal
+    before use and fall back to SessionLocal otherwise.
+    
+    Yields:
+        Async database session
+        
+    Usage:
+        async with get_async_db() as session:
+            session.add(obj)
+            await session.commit()
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database sessions are not configured")
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def close_async_db() -> None:
+    """Dispose of the async engine's connection pool."""
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+def create_missing_tables(bind: Engine) -> List[str]:
+    """
+    Create model tables that do not exist yet.
+    
+    Reflects the table names once instead of letting create_all issue a
+    has_table check per table. Indexes in UPGRADE_INDEXES are also created
+    on tables that already existed, since create_all skips those tables.
+    
+    Args:
+        bind: Engine to create the tables on
+        
+    Returns:
+        Names of the tables that were created
+    """
+    from .models import Base, UPGRADE_INDEXES
+    
+    existing = set(inspect(bind).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    if missing:
+        Base.metadata.create_all(bind=bind, tables=missing, checkfirst=False)
+    for index in UPGRADE_INDEXES:
+        if index.table.name in existing:
+            index.create(bind=bind, checkfirst=True)
+    return [table.name for table in missing]
+
+
 def init_db() -> bool:
     """
     Initialize database tables.
@@ -71,11 +156,9 @@ def init_db() -> bool:
     Returns:
         True if initialization was successful, False otherwise
     """
-    from .models import Base
-    
     try:
         # Create all tables
-        Base.metadata.create_all(bind=engine)
+        create_missing_tables(engine)
         
         # Verify tables were created by checking if we can query them
         db = SessionLocal()
@@ -4,10 +4,11 @@ Database models for exampleOne Orchestrator Studio.
 Defines SQLAlchemy models for credential storage, conversations, messages, and chat metrics.
 """
 
+import operator
 import uuid
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, String, Text, Boolean, DateTime, JSON, Integer, Float, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, DateTime, JSON, Integer, Float, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -61,6 +62,10 @@ class Credential(Base):
     # Active status
     is_active = Column(Boolean, nullable=False, default=True, index=True)
     
+    # Fields exposed by to_safe_dict, fetched in one C-level call
+    _SAFE_FIELDS = ("id", "name", "type", "username", "extra", "created_at", "updated_at", "is_active")
+    _safe_getter = operator.attrgetter(*_SAFE_FIELDS)
+    
     def __repr__(self) -> str:
         """String representation (NEVER include secret)."""
         return f"<Credential(id={self.id}, name={self.name}, type={self.type}, active={self.is_active})>"
@@ -108,16 +113,25 @@ class Credential(Base):
             - NEVER includes secret field
             - Safe to return in API responses
         """
-        return {
-            "id": self.id,
-            "name": self.name,
-            "type": self.type,
-            "username": self.username,
-            "extra": self.extra or {},
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "is_active": self.is_active
-        }
+        data = dict(zip(self._SAFE_FIELDS, self._safe_getter(self)))
+        data["extra"] = data["extra"] or {}
+        created_at, updated_at = data["created_at"], data["updated_at"]
+        data["created_at"] = created_at.isoformat() if created_at else None
+        data["updated_at"] = updated_at.isoformat() if updated_at else None
+        return data
+
+
+# Covers the credential list query: filter by active/type, newest first
+CREDENTIALS_LIST_INDEX = Index(
+    "ix_credentials_active_type_created",
+    Credential.is_active,
+    Credential.type,
+    Credential.created_at.desc()
+)
+
+# Indexes added to tables after their first release. create_all skips tables
+# that already exist, so create_missing_tables() adds these when missing.
+UPGRADE_INDEXES = (CREDENTIALS_LIST_INDEX,)
 
 
 class Conversation(Base):
@@ -438,3 +438,4 @@ class OrchestrationGraph:
         await self.conversation_memory.close()
         await self.cache_manager.close()
         await self.state_store.close()
+        await self.tool_registry.close()
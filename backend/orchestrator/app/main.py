@@ -5,6 +5,7 @@ Entry point for the orchestration backend.
 Uses Settings from config - NO hard-coded values.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
@@ -30,7 +31,8 @@ from .api.api_keys import router as api_keys_router
 from .api.frontend_config import router as frontend_config_router
 from .api.memory_management import router as memory_management_router
 from .api.upgrades import router as upgrades_router
-from .db.database import init_db
+from .db.database import init_db, close_async_db
+from .services.chat_router import close_chat_router
 
 # Configure logging
 logging.basicConfig(
@@ -49,6 +51,13 @@ async def lifespan(app: FastAPI):
     logger.info(f"Debug mode: {settings.debug}")
     logger.info("=" * 80)
     
+    # Eager tasks run until their first real suspension, so short coroutines
+    # (cache hits, background memory writes) skip an event loop round-trip
+    if settings.async_eager_tasks and hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        logger.info("Eager asyncio task factory enabled")
+    logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
+    
     # Initialize database tables
     db_initialized = False
     try:
@@ -114,6 +123,8 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down application")
+    await close_chat_router()
+    await close_async_db()
 
 
 async def seed_default_data():
@@ -152,10 +163,8 @@ async def seed_default_data():
                     }
                 ]
                 
-                for profile_data in default_profiles:
-                    profile = PromptProfile(**profile_data)
-                    db.add(profile)
-                
+                # One batched INSERT, skipping per-object unit-of-work bookkeeping
+                db.bulk_insert_mappings(PromptProfile, default_profiles)
                 db.commit()
                 logger.info(f"✓ Seeded {len(default_profiles)} default prompt profiles")
             else:
@@ -8,6 +8,7 @@ import logging
 import json
 import hashlib
 from typing import Any, Optional
+import orjson
 from ..config import Settings
 
 logger = logging.getLogger(__name__)
@@ -64,9 +65,9 @@ class CacheManager:
         Returns:
             Cache key
         """
-        # Convert data to JSON string and hash it
-        data_str = json.dumps(data, sort_keys=True)
-        data_hash = hashlib.sha256(data_str.encode()).hexdigest()
+        # Hash the canonical JSON bytes directly (no intermediate str/encode)
+        data_bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        data_hash = hashlib.sha256(data_bytes).hexdigest()
         return f"{prefix}:{data_hash}"
     
     async def get(self, key: str) -> Optional[Any]:
@@ -203,7 +204,11 @@ class CacheManager:
         
         if redis_client:
             try:
-                info = await redis_client.info("stats")
+                # Fetch stats and key count in a single round-trip
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.info("stats")
+                    pipe.dbsize()
+                    info, keys = await pipe.execute()
                 return {
                     "backend": "redis",
                     "hits": info.get("keyspace_hits", 0),
@@ -212,7 +217,7 @@ class CacheManager:
                         info.get("keyspace_hits", 0),
                         info.get("keyspace_misses", 0)
                     ),
-                    "keys": await redis_client.dbsize()
+                    "keys": keys
                 }
             except Exception as e:
                 logger.error(f"[Cache] Redis error: {str(e)}")
@@ -8,10 +8,29 @@ import logging
 import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import msgpack
 from ..config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Shared metadata for messages stored without any; never mutated in place.
+_EMPTY_METADATA: Dict[str, Any] = {}
+
+# Computed LLM contexts are cached in Redis for this long; writes drop them.
+_CONTEXT_CACHE_TTL_SECONDS = 300
+
+
+def _pack_message(message: Dict[str, Any]) -> bytes:
+    """Encode a message for Redis storage."""
+    return msgpack.packb(message, use_bin_type=True)
+
+
+def _unpack_message(raw: bytes) -> Dict[str, Any]:
+    """Decode a stored message, accepting legacy JSON entries."""
+    if raw[:1] == b"{":
+        return json.loads(raw)
+    return msgpack.unpackb(raw, raw=False)
+
 
 class ConversationMemory:
     """
@@ -37,6 +56,10 @@ class ConversationMemory:
         
         # In-memory fallback
         self._memory_store: Dict[str, List[Dict[str, Any]]] = {}
+        
+        # Context cache hit rate, for this instance
+        self.context_cache_hits = 0
+        self.context_cache_misses = 0
     
     async def _get_redis_client(self):
         """Get or create Redis client."""
@@ -45,7 +68,7 @@ class ConversationMemory:
                 import redis.asyncio as redis
                 self._redis_client = redis.from_url(
                     self.redis_url,
-                    decode_responses=True
+                    decode_responses=False
                 )
                 logger.info("[Memory] Connected to Redis")
             except ImportError:
@@ -78,7 +101,7 @@ class ConversationMemory:
             "role": role,
             "content": content,
             "timestamp": datetime.utcnow().isoformat(),
-            "metadata": metadata or {}
+            "metadata": metadata if metadata else _EMPTY_METADATA
         }
         
         redis_client = await self._get_redis_client()
@@ -86,9 +109,10 @@ class ConversationMemory:
         if redis_client:
             try:
                 key = f"conversation:{user_id}"
-                await redis_client.lpush(key, json.dumps(message))
+                await redis_client.lpush(key, _pack_message(message))
                 await redis_client.ltrim(key, 0, self.max_messages - 1)
                 await redis_client.expire(key, self.settings.redis_ttl_seconds)
+                await redis_client.delete(f"conversation_context:{user_id}")
                 logger.debug(f"[Memory] Added message to Redis for user {user_id}")
             except Exception as e:
                 logger.error(f"[Memory] Redis error: {str(e)}, falling back to in-memory")
@@ -96,6 +120,54 @@ class ConversationMemory:
         else:
             self._add_to_memory(user_id, message)
     
+    async def add_messages(
+        self,
+        user_id: str,
+        messages: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Add several messages to conversation history in one round-trip.
+        
+        Messages keep their order, so a user turn and its reply can be
+        stored together without racing each other.
+        
+        Args:
+            user_id: User identifier
+            messages: Dicts with role, content and optional metadata
+        """
+        if not self.enabled or not messages:
+            return
+        
+        timestamp = datetime.utcnow().isoformat()
+        records = [
+            {
+                "role": m["role"],
+                "content": m["content"],
+                "timestamp": timestamp,
+                "metadata": m.get("metadata") or _EMPTY_METADATA
+            }
+            for m in messages
+        ]
+        
+        redis_client = await self._get_redis_client()
+        
+        if redis_client:
+            try:
+                key = f"conversation:{user_id}"
+                pipe = redis_client.pipeline(transaction=False)
+                pipe.lpush(key, *[_pack_message(r) for r in records])
+                pipe.ltrim(key, 0, self.max_messages - 1)
+                pipe.expire(key, self.settings.redis_ttl_seconds)
+                pipe.delete(f"conversation_context:{user_id}")
+                await pipe.execute()
+                logger.debug(f"[Memory] Added {len(records)} messages to Redis for user {user_id}")
+                return
+            except Exception as e:
+                logger.error(f"[Memory] Redis error: {str(e)}, falling back to in-memory")
+        
+        for record in records:
+            self._add_to_memory(user_id, record)
+    
     def _add_to_memory(self, user_id: str, message: Dict[str, Any]) -> None:
         """Add message to in-memory store."""
         if user_id not in self._memory_store:
@@ -133,7 +205,7 @@ class ConversationMemory:
             try:
                 key = f"conversation:{user_id}"
                 messages = await redis_client.lrange(key, 0, limit - 1)
-                return [json.loads(msg) for msg in messages]
+                return [_unpack_message(msg) for msg in messages]
             except Exception as e:
                 logger.error(f"[Memory] Redis error: {str(e)}, falling back to in-memory")
                 return self._memory_store.get(user_id, [])[:limit]
@@ -155,16 +227,81 @@ class ConversationMemory:
         Returns:
             List of messages formatted for LLM
         """
-        history = await self.get_history(user_id)
+        if not self.enabled:
+            return []
+        
+        # Contexts are cached per user in a hash keyed by token budget, so a
+        # single DEL on write invalidates every budget
+        redis_client = await self._get_redis_client()
+        cache_key = f"conversation_context:{user_id}"
+        if redis_client:
+            try:
+                cached = await redis_client.hget(cache_key, max_tokens)
+                if cached is not None:
+                    self.context_cache_hits += 1
+                    return msgpack.unpackb(cached, raw=False)
+                self.context_cache_misses += 1
+            except Exception as e:
+                logger.error(f"[Memory] Redis error reading context cache: {str(e)}")
+                redis_client = None
         
-        # Reverse to get chronological order
-        history = list(reversed(history))
+        if redis_client:
+            try:
+                return await self._build_and_cache_context(redis_client, user_id, cache_key, max_tokens)
+            except Exception as e:
+                logger.error(f"[Memory] Redis error building context: {str(e)}")
         
+        return self._build_context(await self.get_history(user_id), max_tokens)
+    
+    async def _build_and_cache_context(
+        self,
+        redis_client,
+        user_id: str,
+        cache_key: str,
+        max_tokens: int
+    ) -> List[Dict[str, str]]:
+        """
+        Build a context from Redis history and cache it unless history changed meanwhile.
+        
+        The history key is WATCHed from the read to the cache write, so a
+        context built from history that a concurrent add/clear has already
+        replaced is returned but never cached.
+        
+        Args:
+            redis_client: Connected Redis client
+            user_id: User identifier
+            cache_key: Context cache hash for the user
+            max_tokens: Approximate maximum tokens
+            
+        Returns:
+            List of messages formatted for LLM
+        """
+        from redis.exceptions import WatchError
+        
+        key = f"conversation:{user_id}"
+        async with redis_client.pipeline(transaction=True) as pipe:
+            await pipe.watch(key)
+            history = [_unpack_message(msg) for msg in await pipe.lrange(key, 0, self.max_messages - 1)]
+            context = self._build_context(history, max_tokens)
+            pipe.multi()
+            pipe.hset(cache_key, max_tokens, msgpack.packb(context, use_bin_type=True))
+            pipe.expire(cache_key, _CONTEXT_CACHE_TTL_SECONDS)
+            try:
+                await pipe.execute()
+            except WatchError:
+                logger.debug(f"[Memory] History changed while building context for user {user_id}, not caching")
+        return context
+    
+    @staticmethod
+    def _build_context(history: List[Dict[str, Any]], max_tokens: int) -> List[Dict[str, str]]:
+        """Select the newest messages within the budget, in chronological order."""
         # Simple token estimation (4 chars ≈ 1 token)
         context = []
         total_chars = 0
         max_chars = max_tokens * 4
         
+        # History is newest first: keep the most recent messages that fit
+        # the budget, then reverse only the kept slice into chronological order
         for msg in history:
             msg_chars = len(msg["content"])
             if total_chars + msg_chars > max_chars:
@@ -176,6 +313,7 @@ class ConversationMemory:
             })
             total_chars += msg_chars
         
+        context.reverse()
         return context
     
     async def clear_history(self, user_id: str) -> None:
@@ -190,7 +328,7 @@ class ConversationMemory:
         if redis_client:
             try:
                 key = f"conversation:{user_id}"
-                await redis_client.delete(key)
+                await redis_client.delete(key, f"conversation_context:{user_id}")
                 logger.info(f"[Memory] Cleared Redis history for user {user_id}")
             except Exception as e:
                 logger.error(f"[Memory] Redis error: {str(e)}")
@@ -218,7 +356,7 @@ class ConversationMemory:
             try:
                 key = f"conversation_summary:{user_id}"
                 summary = await redis_client.get(key)
-                return summary
+                return summary.decode("utf-8") if summary is not None else None
             except Exception as e:
                 logger.error(f"[Memory] Redis error: {str(e)}")
         
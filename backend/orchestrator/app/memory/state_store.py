@@ -4,14 +4,158 @@ State Store - Persists graph execution state.
 Uses Redis/DB from Settings - no hard-coded DSNs.
 """
 
+import time
+import uuid
+import asyncio
 import logging
-import json
-from typing import Any, Optional, Dict
-from datetime import datetime
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, AsyncIterator, Optional, Dict, List, Tuple
+from datetime import datetime, timezone
+import msgpack
+import orjson
 from ..config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Leading byte identifying the payload encoding; legacy JSON payloads start with "{"
+_FORMAT_MSGPACK = b"\x01"
+
+# Redis key prefixes for execution states: canonical UUID IDs are stored
+# compactly as "s:" + 16 raw bytes, any other ID as "state:" + text
+_UUID_KEY_PREFIX = b"s:"
+_TEXT_KEY_PREFIX = b"state:"
+
+# Maximum number of decoded payloads kept for repeated loads
+_DECODE_CACHE_SIZE = 1024
+
+# In-process read cache shadowing Redis for hot executions
+_READ_CACHE_SIZE = 512
+_READ_CACHE_TTL_SECONDS = 5.0
+
+
+def _key(execution_id: str) -> bytes:
+    """Build the Redis key for an execution ID."""
+    try:
+        parsed = uuid.UUID(execution_id)
+    except ValueError:
+        parsed = None
+    if parsed is not None and str(parsed) == execution_id:
+        return _UUID_KEY_PREFIX + parsed.bytes
+    return _TEXT_KEY_PREFIX + execution_id.encode("utf-8")
+
+
+def _legacy_key(execution_id: str) -> Optional[bytes]:
+    """
+    Text key a compactly-keyed ID was stored under before compact keys.
+    
+    Returns None for IDs that still use text keys. Legacy entries are read
+    and deleted through this key until their TTL runs out.
+    """
+    key = _key(execution_id)
+    if key.startswith(_UUID_KEY_PREFIX):
+        return _TEXT_KEY_PREFIX + execution_id.encode("utf-8")
+    return None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize state data to version-prefixed MessagePack bytes."""
+    return _FORMAT_MSGPACK + msgpack.packb(data, datetime=True, use_bin_type=True, default=str)
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Deserialize state data, accepting legacy JSON payloads."""
+    if data[:1] == _FORMAT_MSGPACK:
+        return msgpack.unpackb(memoryview(data)[1:], timestamp=3, raw=False)
+    return orjson.loads(data)
+
+
+# Log a warning every this many evictions from the in-memory fallback
+_EVICTION_WARN_INTERVAL = 1000
+
+
+def _load_path(data: bytes, path: List[str]) -> Any:
+    """
+    Extract one value from an encoded payload without decoding the rest.
+    
+    MessagePack payloads are walked with a streaming unpacker that skips
+    sibling values; legacy JSON payloads are decoded in full.
+    """
+    if data[:1] != _FORMAT_MSGPACK:
+        value = orjson.loads(data)
+        for part in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+    
+    unpacker = msgpack.Unpacker(timestamp=3, raw=False)
+    unpacker.feed(memoryview(data)[1:])
+    for part in path:
+        try:
+            size = unpacker.read_map_header()
+        except ValueError:
+            return None
+        for _ in range(size):
+            if unpacker.unpack() == part:
+                break
+            unpacker.skip()
+        else:
+            return None
+    return unpacker.unpack()
+
+
+class _MemoryFallback:
+    """Size-bounded LRU with per-entry TTL, used when Redis is unavailable."""
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._data: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+    
+    def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+            if self.evictions % _EVICTION_WARN_INTERVAL == 1:
+                logger.warning(
+                    f"[StateStore] In-memory fallback full, evicted {self.evictions} states so far; "
+                    "check Redis availability"
+                )
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a value if present and not expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry[1]
+    
+    def pop(self, key: str) -> None:
+        """Remove a value if present."""
+        self._data.pop(key, None)
+    
+    def keys(self) -> List[str]:
+        """Get keys of all live entries."""
+        self._purge_expired()
+        return list(self._data)
+    
+    def __len__(self) -> int:
+        self._purge_expired()
+        return len(self._data)
+    
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._data.items() if expires_at <= now]
+        for key in expired:
+            del self._data[key]
+
 
 class StateStore:
     """
@@ -30,28 +174,53 @@ class StateStore:
         self.settings = settings
         self.redis_url = settings.get_redis_url()
         
-        # Redis client (lazy initialization)
+        # Redis client (lazy initialization, attempted once)
         self._redis_client = None
+        self._redis_initialized = False
+        self._init_lock = asyncio.Lock()
+        
+        # In-memory fallback (bounded, expires like Redis keys)
+        self._memory_store = _MemoryFallback(settings.state_memory_fallback_max)
         
-        # In-memory fallback
-        self._memory_store: Dict[str, Dict[str, Any]] = {}
+        # Last payload read per execution with its decoded form (LRU)
+        self._decode_cache: OrderedDict[str, Tuple[bytes, Dict[str, Any]]] = OrderedDict()
+        
+        # Recently loaded states with their expiry time (LRU)
+        self._read_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._read_cache_hits = 0
+    
+    async def start(self) -> None:
+        """Eagerly create the Redis client so later calls skip initialization."""
+        await self._get_redis_client()
     
     async def _get_redis_client(self):
         """Get or create Redis client."""
-        if self._redis_client is None and self.redis_url:
+        if self._redis_initialized:
+            return self._redis_client
+        
+        async with self._init_lock:
+            if not self._redis_initialized:
+                self._connect_redis()
+                self._redis_initialized = True
+        
+        return self._redis_client
+    
+    def _connect_redis(self) -> None:
+        """Create the pooled Redis client if Redis is configured."""
+        if self.redis_url:
             try:
                 import redis.asyncio as redis
-                self._redis_client = redis.from_url(
+                pool = redis.ConnectionPool.from_url(
                     self.redis_url,
-                    decode_responses=True
+                    max_connections=self.settings.redis_pool_size,
+                    decode_responses=False
                 )
+                self._redis_client = redis.Redis(connection_pool=pool)
                 logger.info("[StateStore] Connected to Redis")
             except ImportError:
                 logger.warning("[StateStore] redis package not installed, using in-memory storage")
             except Exception as e:
                 logger.warning(f"[StateStore] Redis connection failed: {str(e)}, using in-memory storage")
-        
-        return self._redis_client
     
     async def save_state(
         self,
@@ -71,27 +240,51 @@ class StateStore:
         
         state_data = {
             "state": state,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc),
             "execution_id": execution_id
         }
         
+        self._invalidate(execution_id)
         redis_client = await self._get_redis_client()
         
         if redis_client:
             try:
-                key = f"state:{execution_id}"
-                await redis_client.set(key, json.dumps(state_data), ex=ttl)
+                key = _key(execution_id)
+                legacy_key = _legacy_key(execution_id)
+                if legacy_key is None:
+                    await redis_client.set(key, _dumps(state_data), ex=ttl)
+                else:
+                    # Drop any pre-compact copy so the ID is not listed twice
+                    async with redis_client.pipeline(transaction=False) as pipe:
+                        pipe.set(key, _dumps(state_data), ex=ttl)
+                        pipe.unlink(legacy_key)
+                        await pipe.execute()
                 logger.debug(f"[StateStore] Saved state for execution {execution_id}")
             except Exception as e:
                 logger.error(f"[StateStore] Redis error: {str(e)}, falling back to in-memory")
-                self._memory_store[execution_id] = state_data
+                self._memory_store.set(execution_id, state_data, ttl)
         else:
-            self._memory_store[execution_id] = state_data
+            self._memory_store.set(execution_id, state_data, ttl)
+    
+    @staticmethod
+    async def _get_payload(redis_client, execution_id: str) -> Optional[bytes]:
+        """Fetch an encoded state, falling back to its pre-compact key on a miss."""
+        payload = await redis_client.get(_key(execution_id))
+        if not payload:
+            legacy_key = _legacy_key(execution_id)
+            if legacy_key is not None:
+                payload = await redis_client.get(legacy_key)
+        return payload
     
     async def load_state(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """
         Load execution state.
         
+        Recently loaded states are served from an in-process cache for a few
+        seconds, and repeated loads of an unchanged payload reuse the
+        previously decoded state, so callers must not mutate the returned
+        dictionary.
+        
         Args:
             execution_id: Unique execution identifier
             
@@ -101,23 +294,182 @@ class StateStore:
         redis_client = await self._get_redis_client()
         
         if redis_client:
+            cached = self._read_cache.get(execution_id)
+            if cached is not None and cached[0] > time.monotonic():
+                self._read_cache.move_to_end(execution_id)
+                self._read_cache_hits += 1
+                return cached[1]
+            
             try:
-                key = f"state:{execution_id}"
-                state_str = await redis_client.get(key)
-                if state_str:
-                    state_data = json.loads(state_str)
+                state_bytes = await self._get_payload(redis_client, execution_id)
+                if state_bytes:
+                    state = self._decode(execution_id, state_bytes).get("state")
+                    self._read_cache[execution_id] = (time.monotonic() + _READ_CACHE_TTL_SECONDS, state)
+                    self._read_cache.move_to_end(execution_id)
+                    if len(self._read_cache) > _READ_CACHE_SIZE:
+                        self._read_cache.popitem(last=False)
                     logger.debug(f"[StateStore] Loaded state for execution {execution_id}")
-                    return state_data.get("state")
+                    return state
                 else:
                     logger.debug(f"[StateStore] No state found for execution {execution_id}")
                     return None
             except Exception as e:
                 logger.error(f"[StateStore] Redis error: {str(e)}, checking in-memory")
                 state_data = self._memory_store.get(execution_id)
-                return state_data.get("state") if state_data else None
+                return state_data["state"] if state_data else None
+        else:
+            state_data = self._memory_store.get(execution_id)
+            return state_data["state"] if state_data else None
+    
+    async def load_state_field(self, execution_id: str, field_path: str) -> Any:
+        """
+        Load a single field of an execution state.
+        
+        Only the requested value is materialized, which keeps polling of hot
+        fields (e.g. "current_node") cheap on large states.
+        
+        Args:
+            execution_id: Unique execution identifier
+            field_path: Dot-separated path inside the state (e.g. "plan.metadata")
+            
+        Returns:
+            Field value or None if the state or field is not found
+        """
+        path = field_path.split(".")
+        redis_client = await self._get_redis_client()
+        
+        if redis_client:
+            cached = self._read_cache.get(execution_id)
+            if cached is None or cached[0] <= time.monotonic():
+                try:
+                    state_bytes = await self._get_payload(redis_client, execution_id)
+                    return _load_path(state_bytes, ["state", *path]) if state_bytes else None
+                except Exception as e:
+                    logger.error(f"[StateStore] Redis error: {str(e)}, checking in-memory")
+                    state_data = self._memory_store.get(execution_id)
+                    value = state_data["state"] if state_data else None
+            else:
+                value = cached[1]
         else:
             state_data = self._memory_store.get(execution_id)
-            return state_data.get("state") if state_data else None
+            value = state_data["state"] if state_data else None
+        
+        for part in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+    
+    async def save_many(
+        self,
+        states: Dict[str, Dict[str, Any]],
+        ttl: Optional[int] = None
+    ) -> None:
+        """
+        Save several execution states in a single pipelined round-trip.
+        
+        Args:
+            states: Mapping of execution ID to state data
+            ttl: Time to live in seconds (uses default if not provided)
+        """
+        if not states:
+            return
+        
+        ttl = ttl or self.settings.redis_ttl_seconds
+        timestamp = datetime.now(timezone.utc)
+        
+        batch = {
+            execution_id: {
+                "state": state,
+                "timestamp": timestamp,
+                "execution_id": execution_id
+            }
+            for execution_id, state in states.items()
+        }
+        
+        for execution_id in batch:
+            self._invalidate(execution_id)
+        redis_client = await self._get_redis_client()
+        
+        if redis_client:
+            try:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for execution_id, state_data in batch.items():
+                        pipe.set(_key(execution_id), _dumps(state_data), ex=ttl)
+                    legacy_keys = [k for k in map(_legacy_key, batch) if k is not None]
+                    if legacy_keys:
+                        pipe.unlink(*legacy_keys)
+                    await pipe.execute()
+                logger.debug(f"[StateStore] Saved {len(batch)} states")
+            except Exception as e:
+                logger.error(f"[StateStore] Redis error: {str(e)}, falling back to in-memory")
+                self._save_many_to_memory(batch, ttl)
+        else:
+            self._save_many_to_memory(batch, ttl)
+    
+    def _save_many_to_memory(self, batch: Dict[str, Dict[str, Any]], ttl: int) -> None:
+        """Store a batch of state records in the in-memory fallback."""
+        for execution_id, state_data in batch.items():
+            self._memory_store.set(execution_id, state_data, ttl)
+    
+    async def load_many(self, execution_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Load several execution states with a single MGET.
+        
+        Args:
+            execution_ids: Execution identifiers to load
+            
+        Returns:
+            Mapping of execution ID to state data (None if not found)
+        """
+        if not execution_ids:
+            return {}
+        
+        redis_client = await self._get_redis_client()
+        
+        if redis_client:
+            try:
+                payloads = await redis_client.mget([_key(eid) for eid in execution_ids])
+                # Misses may still be stored under their pre-compact key
+                legacy = [
+                    (i, key) for i, key in enumerate(map(_legacy_key, execution_ids))
+                    if key is not None and not payloads[i]
+                ]
+                if legacy:
+                    legacy_payloads = await redis_client.mget([key for _, key in legacy])
+                    for (i, _), payload in zip(legacy, legacy_payloads):
+                        payloads[i] = payload
+                return {
+                    eid: self._decode(eid, payload).get("state") if payload else None
+                    for eid, payload in zip(execution_ids, payloads)
+                }
+            except Exception as e:
+                logger.error(f"[StateStore] Redis error: {str(e)}, checking in-memory")
+        
+        results = {}
+        for eid in execution_ids:
+            state_data = self._memory_store.get(eid)
+            results[eid] = state_data["state"] if state_data else None
+        return results
+    
+    def _invalidate(self, execution_id: str) -> None:
+        """Drop cached reads for an execution after it is written or deleted."""
+        self._read_cache.pop(execution_id, None)
+        self._decode_cache.pop(execution_id, None)
+    
+    def _decode(self, execution_id: str, payload: bytes) -> Dict[str, Any]:
+        """Decode a payload, reusing the cached result if the bytes are unchanged."""
+        cached = self._decode_cache.get(execution_id)
+        if cached is not None and cached[0] == payload:
+            self._decode_cache.move_to_end(execution_id)
+            return cached[1]
+        
+        state_data = _loads(payload)
+        self._decode_cache[execution_id] = (payload, state_data)
+        self._decode_cache.move_to_end(execution_id)
+        if len(self._decode_cache) > _DECODE_CACHE_SIZE:
+            self._decode_cache.popitem(last=False)
+        return state_data
     
     async def delete_state(self, execution_id: str) -> None:
         """
@@ -130,22 +482,62 @@ class StateStore:
         
         if redis_client:
             try:
-                key = f"state:{execution_id}"
-                await redis_client.delete(key)
+                legacy_key = _legacy_key(execution_id)
+                keys = (_key(execution_id),) if legacy_key is None else (_key(execution_id), legacy_key)
+                await redis_client.delete(*keys)
                 logger.debug(f"[StateStore] Deleted state for execution {execution_id}")
             except Exception as e:
                 logger.error(f"[StateStore] Redis error: {str(e)}")
         
+        self._invalidate(execution_id)
+        
         # Also delete from in-memory
-        if execution_id in self._memory_store:
-            del self._memory_store[execution_id]
+        self._memory_store.pop(execution_id)
     
-    async def list_states(self, pattern: str = "*") -> list[str]:
+    async def _scan_ids(self, redis_client, pattern: str = "*") -> AsyncIterator[List[str]]:
+        """
+        Yield batches of execution IDs matching pattern from both key formats.
+        
+        Compact UUID keys cannot be matched server-side, so they are filtered
+        client-side; text keys are matched by Redis.
+        """
+        scans = (
+            (_UUID_KEY_PREFIX + b"*", True),
+            (_TEXT_KEY_PREFIX + pattern.encode("utf-8"), False),
+        )
+        for match, compact in scans:
+            cursor = 0
+            while True:
+                cursor, batch = await redis_client.scan(
+                    cursor=cursor,
+                    match=match,
+                    count=self.settings.redis_scan_count
+                )
+                if compact:
+                    ids = [
+                        str(uuid.UUID(bytes=k[len(_UUID_KEY_PREFIX):]))
+                        for k in batch
+                        if len(k) == len(_UUID_KEY_PREFIX) + 16
+                    ]
+                    if pattern != "*":
+                        ids = [eid for eid in ids if fnmatchcase(eid, pattern)]
+                else:
+                    ids = [k[len(_TEXT_KEY_PREFIX):].decode("utf-8") for k in batch]
+                if ids:
+                    yield ids
+                if cursor == 0:
+                    break
+    
+    async def list_states(self, pattern: str = "*", limit: Optional[int] = None) -> list[str]:
         """
         List execution IDs matching pattern.
         
+        Without a limit this walks the whole keyspace; pass one in production
+        when only the first few matches are needed.
+        
         Args:
             pattern: Pattern to match (e.g., "user_123_*")
+            limit: Maximum number of IDs to return (None for all)
             
         Returns:
             List of execution IDs
@@ -155,22 +547,16 @@ class StateStore:
         if redis_client:
             try:
                 keys = []
-                cursor = 0
-                while True:
-                    cursor, batch = await redis_client.scan(
-                        cursor=cursor,
-                        match=f"state:{pattern}",
-                        count=100
-                    )
-                    keys.extend([k.replace("state:", "") for k in batch])
-                    if cursor == 0:
-                        break
+                async for ids in self._scan_ids(redis_client, pattern):
+                    keys.extend(ids)
+                    if limit and len(keys) >= limit:
+                        return keys[:limit]
                 return keys
             except Exception as e:
                 logger.error(f"[StateStore] Redis error: {str(e)}")
-                return list(self._memory_store.keys())
+                return self._memory_store.keys()[:limit]
         else:
-            return list(self._memory_store.keys())
+            return self._memory_store.keys()[:limit]
     
     async def get_stats(self) -> Dict[str, Any]:
         """
@@ -185,27 +571,21 @@ class StateStore:
             try:
                 # Count state keys
                 count = 0
-                cursor = 0
-                while True:
-                    cursor, keys = await redis_client.scan(
-                        cursor=cursor,
-                        match="state:*",
-                        count=100
-                    )
-                    count += len(keys)
-                    if cursor == 0:
-                        break
+                async for ids in self._scan_ids(redis_client):
+                    count += len(ids)
                 
                 return {
                     "backend": "redis",
-                    "total_states": count
+                    "total_states": count,
+                    "read_cache_hits": self._read_cache_hits
                 }
             except Exception as e:
                 logger.error(f"[StateStore] Redis error: {str(e)}")
         
         return {
             "backend": "in-memory",
-            "total_states": len(self._memory_store)
+            "total_states": len(self._memory_store),
+            "read_cache_hits": self._read_cache_hits
         }
     
     async def close(self):
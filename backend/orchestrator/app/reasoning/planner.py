@@ -5,10 +5,12 @@ Pure logic module - no HTTP or IO operations.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+from ..compat import DATACLASS_OPTIONS
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +23,11 @@ class TaskStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+# Statuses after which a task will not run again
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED})
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Task:
     """
     Individual task in a plan.
@@ -42,6 +48,9 @@ class Task:
     dependencies: List[str] = None
     status: TaskStatus = TaskStatus.PENDING
     result: Optional[Any] = None
+    _terminal_dict: Optional[Tuple[TaskStatus, Any, Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Initialize dependencies if None."""
@@ -49,8 +58,17 @@ class Task:
             self.dependencies = []
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
+        """
+        Convert to dictionary.
+        
+        Once the task reaches a terminal status the dictionary is built once
+        and reused while status and result stay the same.
+        """
+        cached = self._terminal_dict
+        if cached is not None and cached[0] is self.status and cached[1] is self.result:
+            return cached[2]
+        
+        data = {
             "id": self.id,
             "description": self.description,
             "action": self.action,
@@ -59,9 +77,12 @@ class Task:
             "status": self.status.value,
             "result": self.result
         }
+        if self.status in _TERMINAL_STATUSES:
+            self._terminal_dict = (self.status, self.result, data)
+        return data
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class TaskPlan:
     """
     Complete task execution plan.
@@ -72,29 +93,32 @@ class TaskPlan:
     """
     tasks: List[Task]
     metadata: Dict[str, Any] = None
+    _tasks_by_id: Dict[str, Task] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Initialize metadata if None."""
+        """Initialize metadata if None and index tasks by ID."""
         if self.metadata is None:
             self.metadata = {}
+        self._tasks_by_id = {task.id: task for task in self.tasks}
     
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks_by_id.get(task_id)
     
     def get_ready_tasks(self) -> List[Task]:
         """Get tasks that are ready to execute (dependencies met)."""
+        # Enum members are singletons, so identity checks suffice
+        tasks_by_id = self._tasks_by_id
+        pending = TaskStatus.PENDING
+        completed = TaskStatus.COMPLETED
         ready = []
         for task in self.tasks:
-            if task.status != TaskStatus.PENDING:
+            if task.status is not pending:
                 continue
             
             # Check if all dependencies are completed
             deps_met = all(
-                self.get_task(dep_id).status == TaskStatus.COMPLETED
+                tasks_by_id[dep_id].status is completed
                 for dep_id in task.dependencies
             )
             
@@ -105,10 +129,7 @@ class TaskPlan:
     
     def is_complete(self) -> bool:
         """Check if all tasks are completed or failed."""
-        return all(
-            task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED]
-            for task in self.tasks
-        )
+        return all(task.status in _TERMINAL_STATUSES for task in self.tasks)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -118,6 +139,78 @@ class TaskPlan:
         }
 
 
+# Plan templates: task tuples of (id, description, action, parameters,
+# input_key, dependencies) plus plan metadata. input_key names the
+# parameter that receives the user input, or None.
+_PLAN_TEMPLATES = {
+    "churn_analytics": (
+        (
+            ("task_1", "Retrieve customer data", "data_query",
+             {"query": "SELECT * FROM customers"}, None, ()),
+            ("task_2", "Analyze churn patterns", "external_agent",
+             {"agent": "example_agent", "task": "churn_analysis"}, None, ("task_1",)),
+            ("task_3", "Generate insights report", "llm_call",
+             {"prompt": "Summarize churn analysis results"}, None, ("task_2",)),
+        ),
+        {"intent": "churn_analytics", "complexity": "high"},
+    ),
+    "data_query": (
+        (
+            ("task_1", "Execute data query", "data_query", {}, "query", ()),
+            ("task_2", "Format results", "llm_call",
+             {"prompt": "Format query results for user"}, None, ("task_1",)),
+        ),
+        {"intent": "data_query", "complexity": "medium"},
+    ),
+    "code_generation": (
+        (
+            ("task_1", "Generate code", "llm_call", {"mode": "code_generation"}, "prompt", ()),
+            ("task_2", "Execute code (if requested)", "tool_execution",
+             {"tool": "code_executor"}, None, ("task_1",)),
+        ),
+        {"intent": "code_generation", "complexity": "medium"},
+    ),
+    "web_search": (
+        (
+            ("task_1", "Search the web", "tool_execution", {"tool": "web_search"}, "query", ()),
+            ("task_2", "Synthesize search results", "llm_call",
+             {"prompt": "Summarize search results"}, None, ("task_1",)),
+        ),
+        {"intent": "web_search", "complexity": "low"},
+    ),
+    "tool_execution": (
+        (
+            ("task_1", "Execute tool", "tool_execution", {}, "input", ()),
+        ),
+        {"intent": "tool_execution", "complexity": "low"},
+    ),
+    "general_llm": (
+        (
+            ("task_1", "Process with LLM", "llm_call", {}, "prompt", ()),
+        ),
+        {"intent": "general_llm", "complexity": "low"},
+    ),
+}
+
+
+def _build_plan(intent: str, user_input: str) -> TaskPlan:
+    """Instantiate the plan template for an intent with fresh mutable state."""
+    task_templates, metadata = _PLAN_TEMPLATES[intent]
+    tasks = []
+    for task_id, description, action, parameters, input_key, dependencies in task_templates:
+        parameters = dict(parameters)
+        if input_key is not None:
+            parameters[input_key] = user_input
+        tasks.append(Task(
+            id=task_id,
+            description=description,
+            action=action,
+            parameters=parameters,
+            dependencies=list(dependencies)
+        ))
+    return TaskPlan(tasks=tasks, metadata=dict(metadata))
+
+
 class Planner:
     """
     Task planner for decomposing complex requests.
@@ -149,18 +242,8 @@ class Planner:
         logger.info(f"[Planner] Creating plan for intent: {intent}")
         
         # Simple planning logic - can be enhanced with LLM-based planning
-        if intent == "churn_analytics":
-            return self._plan_churn_analytics(user_input, context)
-        elif intent == "data_query":
-            return self._plan_data_query(user_input, context)
-        elif intent == "code_generation":
-            return self._plan_code_generation(user_input, context)
-        elif intent == "web_search":
-            return self._plan_web_search(user_input, context)
-        elif intent == "tool_execution":
-            return self._plan_tool_execution(user_input, context)
-        else:
-            return self._plan_general_llm(user_input, context)
+        build = self._PLAN_BUILDERS.get(intent, Planner._plan_general_llm)
+        return build(self, user_input, context)
     
     def _plan_churn_analytics(
         self,
@@ -168,33 +251,7 @@ class Planner:
         context: Optional[Dict[str, Any]]
     ) -> TaskPlan:
         """Create plan for churn analytics."""
-        tasks = [
-            Task(
-                id="task_1",
-                description="Retrieve customer data",
-                action="data_query",
-                parameters={"query": "SELECT * FROM customers"}
-            ),
-            Task(
-                id="task_2",
-                description="Analyze churn patterns",
-                action="external_agent",
-                parameters={"agent": "example_agent", "task": "churn_analysis"},
-                dependencies=["task_1"]
-            ),
-            Task(
-                id="task_3",
-                description="Generate insights report",
-                action="llm_call",
-                parameters={"prompt": "Summarize churn analysis results"},
-                dependencies=["task_2"]
-            )
-        ]
-        
-        return TaskPlan(
-            tasks=tasks,
-            metadata={"intent": "churn_analytics", "complexity": "high"}
-        )
+        return _build_plan("churn_analytics", user_input)
     
     def _plan_data_query(
         self,
@@ -202,26 +259,7 @@ class Planner:
         context: Optional[Dict[str, Any]]
     ) -> TaskPlan:
         """Create plan for data query."""
-        tasks = [
-            Task(
-                id="task_1",
-                description="Execute data query",
-                action="data_query",
-                parameters={"query": user_input}
-            ),
-            Task(
-                id="task_2",
-                description="Format results",
-                action="llm_call",
-                parameters={"prompt": "Format query results for user"},
-                dependencies=["task_1"]
-            )
-        ]
-        
-        return TaskPlan(
-            tasks=tasks,
-            metadata={"intent": "data_query", "complexity": "medium"}
-        )
+        return _build_plan("data_query", user_input)
     
     def _plan_code_generation(
         self,
@@ -229,26 +267,7 @@ class Planner:
         context: Optional[Dict[str, Any]]
     ) -> TaskPlan:
         """Create plan for code generation."""
-        tasks = [
-            Task(
-                id="task_1",
-                description="Generate code",
-                action="llm_call",
-                parameters={"prompt": user_input, "mode": "code_generation"}
-            ),
-            Task(
-                id="task_2",
-                description="Execute code (if requested)",
-                action="tool_execution",
-                parameters={"tool": "code_executor"},
-                dependencies=["task_1"]
-            )
-        ]
-        
-        return TaskPlan(
-            tasks=tasks,
-            metadata={"intent": "code_generation", "complexity": "medium"}
-        )
+        return _build_plan("code_generation", user_input)
     
     def _plan_web_search(
         self,
@@ -256,26 +275,7 @@ class Planner:
         context: Optional[Dict[str, Any]]
     ) -> TaskPlan:
         """Create plan for web search."""
-        tasks = [
-            Task(
-                id="task_1",
-                description="Search the web",
-                action="tool_execution",
-                parameters={"tool": "web_search", "query": user_input}
-            ),
-            Task(
-                id="task_2",
-                description="Synthesize search results",
-                action="llm_call",
-                parameters={"prompt": "Summarize search results"},
-                dependencies=["task_1"]
-            )
-        ]
-        
-        return TaskPlan(
-            tasks=tasks,
-            metadata={"intent": "web_search", "complexity": "low"}
-        )
+        return _build_plan("web_search", user_input)
     
     def _plan_tool_execution(
         self,
@@ -283,19 +283,7 @@ class Planner:
         context: Optional[Dict[str, Any]]
     ) -> TaskPlan:
         """Create plan for tool execution."""
-        tasks = [
-            Task(
-                id="task_1",
-                description="Execute tool",
-                action="tool_execution",
-                parameters={"input": user_input}
-            )
-        ]
-        
-        return TaskPlan(
-            tasks=tasks,
-            metadata={"intent": "tool_execution", "complexity": "low"}
-        )
+        return _build_plan("tool_execution", user_input)
     
     def _plan_general_llm(
         self,
@@ -303,16 +291,13 @@ class Planner:
         context: Optional[Dict[str, Any]]
     ) -> TaskPlan:
         """Create plan for general LLM interaction."""
-        tasks = [
-            Task(
-                id="task_1",
-                description="Process with LLM",
-                action="llm_call",
-                parameters={"prompt": user_input}
-            )
-        ]
-        
-        return TaskPlan(
-            tasks=tasks,
-            metadata={"intent": "general_llm", "complexity": "low"}
-        )
+        return _build_plan("general_llm", user_input)
+    
+    # Intent -> plan builder; unknown intents fall back to _plan_general_llm
+    _PLAN_BUILDERS = {
+        "churn_analytics": _plan_churn_analytics,
+        "data_query": _plan_data_query,
+        "code_generation": _plan_code_generation,
+        "web_search": _plan_web_search,
+        "tool_execution": _plan_tool_execution,
+    }
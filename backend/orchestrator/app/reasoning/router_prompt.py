@@ -4,6 +4,7 @@ Intent Router - Classifies user requests into intent categories.
 Pure logic module - no HTTP or IO operations.
 """
 
+import re
 from typing import Dict, Any, Optional
 from enum import Enum
 
@@ -71,6 +72,30 @@ Format your response as JSON:
 """
 
 
+# Keyword rules in priority order: (intent, confidence, reasoning, keywords)
+_INTENT_RULES = [
+    (IntentLabel.CHURN_ANALYTICS, 0.9, "Request contains churn-related keywords",
+     ["churn", "customer retention", "attrition"]),
+    (IntentLabel.DATA_QUERY, 0.85, "Request contains database query keywords",
+     ["query", "database", "select", "data from"]),
+    (IntentLabel.WEB_SEARCH, 0.85, "Request contains search keywords",
+     ["search", "find", "look up", "google"]),
+    (IntentLabel.CODE_GENERATION, 0.8, "Request contains code-related keywords",
+     ["code", "script", "program", "function", "execute"]),
+    (IntentLabel.TOOL_EXECUTION, 0.8, "Request contains tool/API keywords",
+     ["api", "http", "request", "call", "tool"]),
+]
+
+# One pass over the input: a zero-width lookahead tries every position, so
+# overlapping keywords are all seen; group order breaks ties at a position.
+_INTENT_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<r{rank}>" + "|".join(re.escape(word) for word in keywords) + ")"
+        for rank, (_, _, _, keywords) in enumerate(_INTENT_RULES)
+    ) + ")"
+)
+
+
 def classify_intent(user_input: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Classify user intent (placeholder for LLM-based classification).
@@ -85,50 +110,28 @@ def classify_intent(user_input: str, context: Optional[Dict[str, Any]] = None) -
     Returns:
         Classification result with intent, confidence, and reasoning
     """
-    user_input_lower = user_input.lower()
-    
-    # Simple rule-based classification
-    if any(word in user_input_lower for word in ["churn", "customer retention", "attrition"]):
-        return {
-            "intent": IntentLabel.CHURN_ANALYTICS.value,
-            "confidence": 0.9,
-            "reasoning": "Request contains churn-related keywords"
-        }
-    
-    elif any(word in user_input_lower for word in ["query", "database", "select", "data from"]):
-        return {
-            "intent": IntentLabel.DATA_QUERY.value,
-            "confidence": 0.85,
-            "reasoning": "Request contains database query keywords"
-        }
+    # Simple rule-based classification: highest-priority keyword found wins
+    best = len(_INTENT_RULES)
+    for match in _INTENT_RE.finditer(user_input.lower()):
+        rank = int(match.lastgroup[1:])
+        if rank < best:
+            best = rank
+            if rank == 0:
+                break
     
-    elif any(word in user_input_lower for word in ["search", "find", "look up", "google"]):
+    if best < len(_INTENT_RULES):
+        intent, confidence, reasoning, _ = _INTENT_RULES[best]
         return {
-            "intent": IntentLabel.WEB_SEARCH.value,
-            "confidence": 0.85,
-            "reasoning": "Request contains search keywords"
+            "intent": intent.value,
+            "confidence": confidence,
+            "reasoning": reasoning
         }
     
-    elif any(word in user_input_lower for word in ["code", "script", "program", "function", "execute"]):
-        return {
-            "intent": IntentLabel.CODE_GENERATION.value,
-            "confidence": 0.8,
-            "reasoning": "Request contains code-related keywords"
-        }
-    
-    elif any(word in user_input_lower for word in ["api", "http", "request", "call", "tool"]):
-        return {
-            "intent": IntentLabel.TOOL_EXECUTION.value,
-            "confidence": 0.8,
-            "reasoning": "Request contains tool/API keywords"
-        }
-    
-    else:
-        return {
-            "intent": IntentLabel.GENERAL_LLM.value,
-            "confidence": 0.7,
-            "reasoning": "Default to general LLM for conversation"
-        }
+    return {
+        "intent": IntentLabel.GENERAL_LLM.value,
+        "confidence": 0.7,
+        "reasoning": "Default to general LLM for conversation"
+    }
 
 
 def get_intent_description(intent: str) -> str:
@@ -7,13 +7,21 @@ Provides encryption, decryption, and credential management utilities.
 from .credentials import (
     get_crypto_key,
     encrypt_secret,
+    encrypt_secret_bytes,
+    encrypt_secrets,
     decrypt_secret,
+    decrypt_secret_bytes,
+    reset_key_cache,
     CredentialEncryptionError
 )
 
 __all__ = [
     "get_crypto_key",
     "encrypt_secret",
+    "encrypt_secret_bytes",
+    "encrypt_secrets",
     "decrypt_secret",
+    "decrypt_secret_bytes",
+    "reset_key_cache",
     "CredentialEncryptionError"
 ]
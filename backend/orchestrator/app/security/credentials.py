@@ -1,7 +1,8 @@
 """
 Credential encryption and decryption utilities.
 
-Provides secure encryption/decryption of credentials using Fernet (AES-128).
+Provides secure encryption/decryption of credentials using AES-256-GCM,
+with read support for legacy Fernet (AES-128) tokens.
 
 Security Rules:
 - Master key MUST be stored in environment variable ORCH_CRED_KEY
@@ -11,22 +12,51 @@ Security Rules:
 """
 
 import os
+import base64
+import asyncio
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 logger = logging.getLogger(__name__)
 
+# Leading byte of AES-256-GCM tokens; legacy Fernet tokens start with 0x80
+_GCM_VERSION = b"\x02"
+_GCM_NONCE_SIZE = 12
+_GCM_KEY_INFO = b"orchestrator-credentials-aes256gcm"
+
+# Secrets encrypted per worker-thread task in encrypt_secrets
+_ENCRYPT_BATCH_SIZE = 1000
+
+# Credential types accepted by validate_credential_type
+_VALID_CREDENTIAL_TYPES = frozenset({
+    "ssh",
+    "http_basic",
+    "bearer_token",
+    "db_dsn",
+    "api_key",
+    "custom"
+})
+
 
 class CredentialEncryptionError(Exception):
     """Exception raised for credential encryption/decryption errors."""
     pass
 
 
+@lru_cache(maxsize=1)
 def get_crypto_key() -> bytes:
     """
     Get the master encryption key from environment.
     
+    The validated key is cached for the lifetime of the process; call
+    reset_key_cache() after changing ORCH_CRED_KEY.
+    
     Returns:
         Master encryption key as bytes
         
@@ -76,9 +106,80 @@ def get_crypto_key() -> bytes:
         raise CredentialEncryptionError(error_msg)
 
 
+@lru_cache(maxsize=1)
+def _get_fernet() -> Fernet:
+    """Get the shared Fernet instance for the configured master key."""
+    return Fernet(get_crypto_key())
+
+
+@lru_cache(maxsize=1)
+def _get_aead() -> AESGCM:
+    """Get the shared AES-256-GCM cipher derived from the master key."""
+    hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=_GCM_KEY_INFO)
+    return AESGCM(hkdf.derive(get_crypto_key()))
+
+
+def reset_key_cache() -> None:
+    """Forget the cached master key and derived ciphers."""
+    _get_aead.cache_clear()
+    _get_fernet.cache_clear()
+    get_crypto_key.cache_clear()
+
+
+def _encrypt(plain_bytes: bytes) -> bytes:
+    """Encrypt bytes into a base64 token: version || nonce || ciphertext+tag."""
+    nonce = os.urandom(_GCM_NONCE_SIZE)
+    sealed = _get_aead().encrypt(nonce, plain_bytes, None)
+    return base64.urlsafe_b64encode(_GCM_VERSION + nonce + sealed)
+
+
+def _decrypt(token: bytes) -> bytes:
+    """Decrypt a token produced by _encrypt or by legacy Fernet encryption."""
+    raw = base64.urlsafe_b64decode(token)
+    if raw[:1] != _GCM_VERSION:
+        return _get_fernet().decrypt(token)
+    nonce = raw[1:1 + _GCM_NONCE_SIZE]
+    return _get_aead().decrypt(nonce, raw[1 + _GCM_NONCE_SIZE:], None)
+
+
+def encrypt_secret_bytes(plain_bytes: bytes) -> bytes:
+    """
+    Encrypt raw secret bytes using AES-256-GCM.
+    
+    For bytes-native stores this skips the UTF-8 round-trips of
+    encrypt_secret.
+    
+    Args:
+        plain_bytes: Plain secret bytes to encrypt
+        
+    Returns:
+        Encrypted secret as base64-encoded bytes
+        
+    Raises:
+        CredentialEncryptionError: If encryption fails
+    """
+    if not plain_bytes:
+        raise CredentialEncryptionError("Cannot encrypt empty secret")
+    
+    try:
+        encrypted_bytes = _encrypt(plain_bytes)
+        
+        logger.debug("Secret encrypted successfully")
+        return encrypted_bytes
+        
+    except CredentialEncryptionError:
+        # Re-raise key configuration errors
+        raise
+    except Exception as e:
+        # NEVER include the plain text in the error message
+        error_msg = f"Failed to encrypt secret: {type(e).__name__}"
+        logger.error(error_msg)
+        raise CredentialEncryptionError(error_msg)
+
+
 def encrypt_secret(plain_text: str) -> str:
     """
-    Encrypt a secret using Fernet encryption.
+    Encrypt a secret using AES-256-GCM.
     
     Args:
         plain_text: Plain text secret to encrypt
@@ -90,8 +191,8 @@ def encrypt_secret(plain_text: str) -> str:
         CredentialEncryptionError: If encryption fails
         
     Security:
-        - Uses AES-128 encryption in CBC mode with PKCS7 padding
-        - Includes HMAC for authentication
+        - Uses AES-256-GCM with a random 96-bit nonce per secret
+        - GCM tag authenticates the ciphertext
         - NEVER logs the plain text
         - NEVER includes plain text in exceptions
     """
@@ -99,30 +200,103 @@ def encrypt_secret(plain_text: str) -> str:
         raise CredentialEncryptionError("Cannot encrypt empty secret")
     
     try:
-        key = get_crypto_key()
-        fernet = Fernet(key)
-        
-        # Encrypt the secret
         plain_bytes = plain_text.encode('utf-8')
-        encrypted_bytes = fernet.encrypt(plain_bytes)
-        encrypted_str = encrypted_bytes.decode('utf-8')
+    except UnicodeError as e:
+        error_msg = f"Failed to encrypt secret: {type(e).__name__}"
+        logger.error(error_msg)
+        raise CredentialEncryptionError(error_msg)
+    
+    return encrypt_secret_bytes(plain_bytes).decode('ascii')
+
+
+async def encrypt_secrets(plain_texts: List[str]) -> List[str]:
+    """
+    Encrypt many secrets off the event loop.
+    
+    Large batches are split into chunks encrypted concurrently in the
+    default thread pool; cryptography releases the GIL inside OpenSSL.
+    
+    Args:
+        plain_texts: Plain text secrets to encrypt
         
-        logger.debug("Secret encrypted successfully")
-        return encrypted_str
+    Returns:
+        Encrypted secrets, in the same order as the input
+        
+    Raises:
+        CredentialEncryptionError: If any secret is empty or encryption fails
+    """
+    if not all(plain_texts):
+        raise CredentialEncryptionError("Cannot encrypt empty secret")
+    
+    try:
+        # Derive the cipher up front so key errors surface before dispatch
+        _get_aead()
+        loop = asyncio.get_running_loop()
+        
+        def encrypt_chunk(chunk: List[str]) -> List[str]:
+            return [_encrypt(p.encode('utf-8')).decode('utf-8') for p in chunk]
+        
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(None, encrypt_chunk, plain_texts[i:i + _ENCRYPT_BATCH_SIZE])
+            for i in range(0, len(plain_texts), _ENCRYPT_BATCH_SIZE)
+        ))
+        
+        logger.debug(f"Encrypted {len(plain_texts)} secrets")
+        return [encrypted for chunk in chunks for encrypted in chunk]
         
     except CredentialEncryptionError:
         # Re-raise key configuration errors
         raise
     except Exception as e:
         # NEVER include the plain text in the error message
-        error_msg = f"Failed to encrypt secret: {type(e).__name__}"
+        error_msg = f"Failed to encrypt secrets: {type(e).__name__}"
+        logger.error(error_msg)
+        raise CredentialEncryptionError(error_msg)
+
+
+def decrypt_secret_bytes(encrypted_bytes: bytes) -> bytes:
+    """
+    Decrypt a base64-encoded token to raw secret bytes.
+    
+    Accepts AES-256-GCM tokens and legacy Fernet tokens. The same handling
+    rules as decrypt_secret apply to the returned bytes.
+    
+    Args:
+        encrypted_bytes: Encrypted secret as base64-encoded bytes
+        
+    Returns:
+        Decrypted secret bytes
+        
+    Raises:
+        CredentialEncryptionError: If decryption fails
+    """
+    if not encrypted_bytes:
+        raise CredentialEncryptionError("Cannot decrypt empty secret")
+    
+    try:
+        decrypted_bytes = _decrypt(encrypted_bytes)
+        
+        logger.debug("Secret decrypted successfully")
+        return decrypted_bytes
+        
+    except (InvalidToken, InvalidTag):
+        # This happens if the key is wrong or data is corrupted
+        error_msg = "Failed to decrypt secret: Invalid encryption key or corrupted data"
+        logger.error(error_msg)
+        raise CredentialEncryptionError(error_msg)
+    except CredentialEncryptionError:
+        # Re-raise key configuration errors
+        raise
+    except Exception as e:
+        # NEVER include the encrypted or decrypted text in the error message
+        error_msg = f"Failed to decrypt secret: {type(e).__name__}"
         logger.error(error_msg)
         raise CredentialEncryptionError(error_msg)
 
 
 def decrypt_secret(encrypted_text: str) -> str:
     """
-    Decrypt a secret using Fernet decryption.
+    Decrypt a secret encrypted with AES-256-GCM or legacy Fernet.
     
     Args:
         encrypted_text: Encrypted secret as base64-encoded string
@@ -151,27 +325,17 @@ def decrypt_secret(encrypted_text: str) -> str:
         raise CredentialEncryptionError("Cannot decrypt empty secret")
     
     try:
-        key = get_crypto_key()
-        fernet = Fernet(key)
-        
-        # Decrypt the secret
-        encrypted_bytes = encrypted_text.encode('utf-8')
-        decrypted_bytes = fernet.decrypt(encrypted_bytes)
-        decrypted_str = decrypted_bytes.decode('utf-8')
-        
-        logger.debug("Secret decrypted successfully")
-        return decrypted_str
-        
-    except InvalidToken:
-        # This happens if the key is wrong or data is corrupted
+        encrypted_bytes = encrypted_text.encode('ascii')
+    except UnicodeError:
         error_msg = "Failed to decrypt secret: Invalid encryption key or corrupted data"
         logger.error(error_msg)
         raise CredentialEncryptionError(error_msg)
-    except CredentialEncryptionError:
-        # Re-raise key configuration errors
-        raise
-    except Exception as e:
-        # NEVER include the encrypted or decrypted text in the error message
+    
+    decrypted_bytes = decrypt_secret_bytes(encrypted_bytes)
+    try:
+        return decrypted_bytes.decode('utf-8')
+    except UnicodeError as e:
+        # NEVER include the decrypted bytes in the error message
         error_msg = f"Failed to decrypt secret: {type(e).__name__}"
         logger.error(error_msg)
         raise CredentialEncryptionError(error_msg)
@@ -219,12 +383,4 @@ def validate_credential_type(cred_type: str) -> bool:
         - api_key: API key
         - custom: Custom credential type
     """
-    valid_types = {
-        "ssh",
-        "http_basic",
-        "bearer_token",
-        "db_dsn",
-        "api_key",
-        "custom"
-    }
-    return cred_type in valid_types
+    return cred_type in _VALID_CREDENTIAL_TYPES
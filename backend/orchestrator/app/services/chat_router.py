@@ -4,22 +4,115 @@ Chat Router Service - Handles routing logic for Chat Studio.
 Routes chat requests to appropriate backends based on routing profile.
 """
 
+import asyncio
 import logging
+import re
 import time
-from typing import Dict, Any, List, Optional, AsyncGenerator
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, AsyncGenerator, Hashable, Set, Tuple
 import types
-from datetime import datetime
+from datetime import datetime, timezone
 
+from ..compat import DATACLASS_OPTIONS
 from ..config import Settings
+from ..api.model_standardization import ModelParser, ModelProvider
 from ..clients.llm_client import LLMClient
 from ..clients.external_agent_client import ExternalAgentClient
 from ..graph import OrchestrationGraph, GraphState
 from ..memory.conversation_memory import ConversationMemory
 from ..db.models import ChatMetric
-from ..db.database import get_db
+from ..db import database
 
 logger = logging.getLogger(__name__)
 
+# Background metric persistence: queue bound, max rows per COMMIT, and how
+# long the worker waits to fill a batch once the first metric arrives
+_METRIC_QUEUE_SIZE = 10_000
+_METRIC_BATCH_SIZE = 100
+_METRIC_BATCH_WAIT_SECONDS = 0.1
+
+# How long a superseded router waits before closing once idle, covering
+# callers that fetched it but have not started their request yet
+_RETIRE_GRACE_SECONDS = 5.0
+
+
+# Base-URL hints identifying which provider a configured connection serves
+_PROVIDER_URL_PATTERNS = (
+    (ModelProvider.OLLAMA, re.compile(r"11434|ollama", re.IGNORECASE)),
+    (ModelProvider.OPENAI, re.compile(r"openai|/v1", re.IGNORECASE)),
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_provider(model_id: str) -> ModelProvider:
+    """Provider of a model ID; chat traffic reuses a handful of IDs."""
+    return ModelParser.parse(model_id).provider
+
+
+@dataclass(**DATACLASS_OPTIONS)
+class MetricRecord:
+    """One chat request's metric row, converted to ChatMetric only when written."""
+    conversation_id: Optional[str]
+    model_id: Optional[str]
+    routing_profile: str
+    request_time: float  # time.time() at request start
+    latency_ms: Optional[float] = None
+    success: bool = True
+    tokens_in: Optional[int] = None
+    tokens_out: Optional[int] = None
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+    metric_metadata: Optional[Dict[str, Any]] = None
+    
+    def to_model(self) -> ChatMetric:
+        """Build the ChatMetric row for this record."""
+        return ChatMetric(
+            conversation_id=self.conversation_id,
+            model_id=self.model_id,
+            routing_profile=self.routing_profile,
+            # Column stores naive UTC, like its datetime.utcnow default
+            request_timestamp=datetime.fromtimestamp(self.request_time, timezone.utc).replace(tzinfo=None),
+            latency_ms=self.latency_ms,
+            success=self.success,
+            tokens_in=self.tokens_in,
+            tokens_out=self.tokens_out,
+            error_code=self.error_code,
+            error_message=self.error_message,
+            metric_metadata=self.metric_metadata or {}
+        )
+
+
+class _ResponseCache:
+    """Size-bounded LRU of direct-LLM responses with a shared TTL."""
+    
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Tuple[float, Dict[str, Any]]] = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Get a response if present and not expired."""
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    def set(self, key: Hashable, value: Dict[str, Any]) -> None:
+        """Store a response, evicting the least recently used entries if full."""
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
 
 class ChatRouter:
     """
@@ -40,41 +133,79 @@ class ChatRouter:
         self.settings = settings
         self.llm_client = LLMClient(settings)
         self.conversation_memory = ConversationMemory(settings)
+        # Per-connection clients, kept open so HTTP/TLS pools survive across requests
+        self._client_cache: Dict[Tuple[str, Optional[str]], LLMClient] = {}
+        # Per-connection cap on in-flight LLM requests, same key as the client cache
+        self._llm_semaphores: Dict[Tuple[str, Optional[str]], asyncio.Semaphore] = {}
+        # Metrics are persisted by a background worker, started on first use
+        self._metric_queue: Optional[asyncio.Queue] = None
+        self._metric_worker: Optional[asyncio.Task] = None
+        # Fire-and-forget work (memory writes) kept referenced until done
+        self._background_tasks: Set[asyncio.Task] = set()
+        # First configured connection per provider, built on first lookup
+        self._provider_conn_index: Optional[Dict[ModelProvider, Tuple[str, Optional[str]]]] = None
+        # Orchestration graph for tools_data, built on first use; per-run state lives in GraphState
+        self._graph: Optional[OrchestrationGraph] = None
+        # Direct-LLM calls in progress, by the same key as the response cache
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        # Exact-match cache of direct-LLM answers for repeated prompts
+        self._response_cache: Optional[_ResponseCache] = None
+        if settings.cache_enabled and settings.chat_response_cache_size > 0:
+            self._response_cache = _ResponseCache(
+                settings.chat_response_cache_size,
+                settings.chat_response_cache_ttl_seconds
+            )
+        # Requests using this router; once superseded it closes when idle
+        self._active_requests = 0
+        self._retired = False
+        self._closed = False
+        self._close_task: Optional[asyncio.Task] = None
 
     def _get_connection_by_id(self, connection_id: str) -> Dict[str, Any]:
         """Get specific connection by ID from llm_connections."""
         try:
             conns = getattr(self.settings, 'llm_connections', {}) or {}
-            logger.info(f"[Chat Router] Looking for connection_id: {connection_id}, available connections: {list(conns.keys())}")
-            if connection_id in conns:
-                cfg = conns[connection_id]
-                result = {"base_url": getattr(cfg, 'base_url', ''), "api_key": getattr(cfg, 'api_key', None)}
-                logger.info(f"[Chat Router] Found connection: {result}")
-                return result
+            cfg = conns.get(connection_id)
+            if cfg is not None:
+                base_url = getattr(cfg, 'base_url', '')
+                logger.debug("[Chat Router] Using connection %s (%s)", connection_id, base_url)
+                return {"base_url": base_url, "api_key": getattr(cfg, 'api_key', None)}
+            logger.info(f"[Chat Router] Connection {connection_id} not found, available connections: {list(conns.keys())}")
         except Exception as e:
             logger.error(f"[Chat Router] Error getting connection: {e}")
         # Fallback to default
         if getattr(self.settings, 'llm_base_url', None):
             fallback = {"base_url": self.settings.llm_base_url, "api_key": getattr(self.settings, 'llm_api_key', None)}
-            logger.warning(f"[Chat Router] Using fallback connection: {fallback}")
+            logger.warning(f"[Chat Router] Using fallback connection: {fallback['base_url']}")
             return fallback
         return {"base_url": "http://localhost:11434", "api_key": None}
     
+    def _build_provider_conn_index(self) -> Dict[ModelProvider, Tuple[str, Optional[str]]]:
+        """
+        Map each provider to the first GUI-configured connection that serves it.
+        
+        Built once per router; a settings reload replaces the router (see
+        get_chat_router), which rebuilds the index.
+        """
+        index: Dict[ModelProvider, Tuple[str, Optional[str]]] = {}
+        for _, cfg in (getattr(self.settings, 'llm_connections', {}) or {}).items():
+            base = getattr(cfg, 'base_url', None) or ''
+            conn = (base, getattr(cfg, 'api_key', None))
+            for provider, pattern in _PROVIDER_URL_PATTERNS:
+                if pattern.search(base):
+                    index.setdefault(provider, conn)
+        return index
+    
     def _select_connection_for_model(self, model_id: Optional[str]) -> Dict[str, Any]:
         """Select base_url/api_key based on model provider and configured connections."""
         try:
-            from ..api.model_standardization import ModelParser, ModelProvider
-            provider = None
-            if model_id:
-                provider = ModelParser.parse(model_id).provider
+            provider = _parse_provider(model_id) if model_id else None
             # Prefer GUI-configured connections
-            for _, cfg in (getattr(self.settings, 'llm_connections', {}) or {}).items():
-                base = getattr(cfg, 'base_url', None) or ''
-                bl = base.lower()
-                if provider == ModelProvider.OLLAMA and ("11434" in bl or "ollama" in bl):
-                    return {"base_url": base, "api_key": getattr(cfg, 'api_key', None)}
-                if provider == ModelProvider.OPENAI and ("openai" in bl or "/v1" in bl):
-                    return {"base_url": base, "api_key": getattr(cfg, 'api_key', None)}
+            if self._provider_conn_index is None:
+                self._provider_conn_index = self._build_provider_conn_index()
+            conn = self._provider_conn_index.get(provider)
+            if conn is not None:
+                return {"base_url": conn[0], "api_key": conn[1]}
             # Fallback to single configured server
             if getattr(self.settings, 'llm_base_url', None):
                 return {"base_url": self.settings.llm_base_url, "api_key": getattr(self.settings, 'llm_api_key', None)}
@@ -92,9 +223,74 @@ class ChatRouter:
             llm_max_retries=self.settings.llm_max_retries,
             llm_api_key=api_key,
             llm_temperature=self.settings.llm_temperature,
-            llm_max_tokens=self.settings.llm_max_tokens
+            llm_max_tokens=self.settings.llm_max_tokens,
+            llm_max_keepalive_connections=self.settings.llm_max_keepalive_connections
         )
         return ns
+
+    def _get_or_create_client(self, base_url: str, api_key: Optional[str]) -> LLMClient:
+        """
+        Return the cached LLMClient for a connection, creating it on first use.
+        
+        The settings namespace is built once per connection and lives on the
+        client. Model/temperature defaults need not be part of the key: a
+        settings reload yields a new Settings object and get_chat_router()
+        replaces the router, cache included.
+        """
+        key = (base_url, api_key)
+        client = self._client_cache.get(key)
+        if client is None:
+            client = LLMClient(self._make_temp_settings(base_url, api_key))
+            self._client_cache[key] = client
+        return client
+    
+    def _spawn(self, coro) -> None:
+        """Run a coroutine in the background, holding a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    def _acquire(self) -> None:
+        """Count a request that is using this router."""
+        self._active_requests += 1
+    
+    def _release(self) -> None:
+        """Finish a request; close a superseded router once none remain."""
+        self._active_requests -= 1
+        if self._retired and self._active_requests == 0:
+            self._schedule_close()
+    
+    def retire(self) -> None:
+        """Mark the router as superseded; it closes once its requests finish."""
+        self._retired = True
+        if self._active_requests == 0:
+            self._schedule_close()
+    
+    def _schedule_close(self) -> None:
+        """Start the delayed close of a retired router, if not already pending."""
+        if self._close_task is not None or self._closed:
+            return
+        try:
+            self._close_task = asyncio.get_running_loop().create_task(self._close_when_idle())
+        except RuntimeError:
+            # No running loop; close_chat_router() closes it at shutdown
+            pass
+    
+    async def _close_when_idle(self) -> None:
+        """Close the router after the grace period unless requests arrived meanwhile."""
+        await asyncio.sleep(_RETIRE_GRACE_SECONDS)
+        self._close_task = None
+        if self._active_requests == 0:
+            await self.close()
+    
+    def _get_semaphore(self, base_url: str, api_key: Optional[str]) -> asyncio.Semaphore:
+        """Return the concurrency limiter for a connection, creating it on first use."""
+        key = (base_url, api_key)
+        semaphore = self._llm_semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.settings.llm_max_concurrency)
+            self._llm_semaphores[key] = semaphore
+        return semaphore
     
     async def route_message(
         self,
@@ -126,55 +322,53 @@ class ChatRouter:
             Response dictionary with answer and metadata
         """
         start_time = time.time()
-        metric_data = {
-            "conversation_id": conversation_id,
-            "model_id": model_id,
-            "routing_profile": routing_profile,
-            "request_timestamp": datetime.utcnow()
-        }
+        metric = MetricRecord(
+            conversation_id=conversation_id,
+            model_id=model_id,
+            routing_profile=routing_profile,
+            request_time=start_time
+        )
         
+        self._acquire()
         try:
-            # Build messages list
-            messages = await self._build_messages(
-                message=message,
-                user_id=user_id or "default",
-                use_memory=use_memory,
-                system_prompt=system_prompt
-            )
-            
-            # Route based on profile
+            # Fetch memory context while the LLM connection is selected;
+            # without memory the list is built inline, no coroutine needed
+            messages_task = None
+            if use_memory:
+                messages_task = asyncio.ensure_future(self._build_messages(
+                    message=message,
+                    user_id=user_id or "default",
+                    use_memory=use_memory,
+                    system_prompt=system_prompt
+                ))
+            connection = None
             if routing_profile == "direct_llm":
-                result = await self._route_direct_llm(messages, model_id, metadata)
-            elif routing_profile == "tools_data":
-                result = await self._route_tools_data(message, user_id, use_tools, metadata)
+                connection = self._select_connection_for_model(model_id)
+            if messages_task is not None:
+                messages = await messages_task
             else:
-                raise ValueError(f"Unknown routing profile: {routing_profile}")
+                messages = self._assemble_messages(message, system_prompt)
+            
+            result = await self._dispatch(
+                routing_profile, message, messages, model_id, user_id, use_tools, metadata,
+                connection=connection
+            )
             
             # Calculate metrics
-            latency_ms = (time.time() - start_time) * 1000
-            metric_data.update({
-                "latency_ms": latency_ms,
-                "success": True,
-                "tokens_in": result.get("tokens_in"),
-                "tokens_out": result.get("tokens_out")
-            })
+            metric.latency_ms = (time.time() - start_time) * 1000
+            metric.tokens_in = result.get("tokens_in")
+            metric.tokens_out = result.get("tokens_out")
             
             # Store metric
-            await self._store_metric(metric_data)
+            await self._store_metric(metric)
             
             # Store in memory if enabled
             if use_memory and user_id:
-                await self.conversation_memory.add_message(
-                    user_id=user_id,
-                    role="user",
-                    content=message
-                )
-                await self.conversation_memory.add_message(
-                    user_id=user_id,
-                    role="assistant",
-                    content=result.get("answer", ""),
-                    metadata=result.get("metadata", {})
-                )
+                await self.conversation_memory.add_messages(user_id, [
+                    {"role": "user", "content": message},
+                    {"role": "assistant", "content": result.get("answer", ""),
+                     "metadata": result.get("metadata", {})}
+                ])
             
             return result
             
@@ -182,16 +376,16 @@ class ChatRouter:
             logger.error(f"[ChatRouter] Error routing message: {str(e)}")
             
             # Store error metric
-            latency_ms = (time.time() - start_time) * 1000
-            metric_data.update({
-                "latency_ms": latency_ms,
-                "success": False,
-                "error_code": type(e).__name__,
-                "error_message": str(e)
-            })
-            await self._store_metric(metric_data)
+            metric.latency_ms = (time.time() - start_time) * 1000
+            metric.success = False
+            metric.error_code = type(e).__name__
+            metric.error_message = str(e)
+            await self._store_metric(metric)
             
             raise
+        
+        finally:
+            self._release()
     
     async def stream_message(
         self,
@@ -223,70 +417,103 @@ class ChatRouter:
         """
         start_time = time.time()
         
+        self._acquire()
         try:
-            # Build messages list
-            messages = await self._build_messages(
-                message=message,
-                user_id=user_id or "default",
-                use_memory=use_memory,
-                system_prompt=system_prompt
-            )
-            
-            # Only direct_llm supports streaming currently
+            # Fetch memory context while the LLM connection is selected;
+            # without memory the list is built inline, no coroutine needed
+            messages_task = None
+            if use_memory:
+                messages_task = asyncio.ensure_future(self._build_messages(
+                    message=message,
+                    user_id=user_id or "default",
+                    use_memory=use_memory,
+                    system_prompt=system_prompt
+                ))
+            sel = None
             if routing_profile == "direct_llm":
-                full_response = ""
                 # Use specific connection if provided, otherwise select based on model
                 if connection_id:
                     sel = self._get_connection_by_id(connection_id)
                 else:
                     sel = self._select_connection_for_model(model_id)
-                tmp_settings = self._make_temp_settings(sel["base_url"], sel.get("api_key"))
-                client = LLMClient(tmp_settings)
-                async for chunk in client.stream(messages=messages, model=model_id):
-                    full_response += chunk
-                    yield chunk
-                await client.close()
+            if messages_task is not None:
+                messages = await messages_task
+            else:
+                messages = self._assemble_messages(message, system_prompt)
+            
+            # Only direct_llm supports streaming currently
+            if routing_profile == "direct_llm":
+                chunks: List[str] = []
+                client = self._get_or_create_client(sel["base_url"], sel.get("api_key"))
+                async with self._get_semaphore(sel["base_url"], sel.get("api_key")):
+                    async for chunk in client.stream(messages=messages, model=model_id):
+                        chunks.append(chunk)
+                        yield chunk
                 
-                # Store in memory after streaming completes
+                # Store in memory after streaming completes, without holding the client
                 if use_memory and user_id:
-                    await self.conversation_memory.add_message(
-                        user_id=user_id,
-                        role="user",
-                        content=message
-                    )
-                    await self.conversation_memory.add_message(
-                        user_id=user_id,
-                        role="assistant",
-                        content=full_response
-                    )
+                    full_response = "".join(chunks)
+                    self._spawn(self.conversation_memory.add_messages(user_id, [
+                        {"role": "user", "content": message},
+                        {"role": "assistant", "content": full_response}
+                    ]))
                 
                 # Store metric
-                latency_ms = (time.time() - start_time) * 1000
-                await self._store_metric({
-                    "conversation_id": conversation_id,
-                    "model_id": model_id,
-                    "routing_profile": routing_profile,
-                    "request_timestamp": datetime.utcnow(),
-                    "latency_ms": latency_ms,
-                    "success": True
-                })
-            else:
-                # For non-streaming profiles, get full response and yield it
-                result = await self.route_message(
-                    message=message,
+                await self._store_metric(MetricRecord(
                     conversation_id=conversation_id,
                     model_id=model_id,
                     routing_profile=routing_profile,
-                    use_memory=use_memory,
-                    user_id=user_id,
-                    system_prompt=system_prompt,
-                    metadata=metadata
+                    request_time=start_time,
+                    latency_ms=(time.time() - start_time) * 1000
+                ))
+            else:
+                # For non-streaming profiles, reuse the messages built above and yield the full response
+                result = await self._dispatch(
+                    routing_profile, message, messages, model_id, user_id, False, metadata
                 )
                 yield result.get("answer", "")
                 
+                if use_memory and user_id:
+                    self._spawn(self.conversation_memory.add_messages(user_id, [
+                        {"role": "user", "content": message},
+                        {"role": "assistant", "content": result.get("answer", ""),
+                         "metadata": result.get("metadata", {})}
+                    ]))
+                
+                await self._store_metric(MetricRecord(
+                    conversation_id=conversation_id,
+                    model_id=model_id,
+                    routing_profile=routing_profile,
+                    request_time=start_time,
+                    latency_ms=(time.time() - start_time) * 1000,
+                    tokens_in=result.get("tokens_in"),
+                    tokens_out=result.get("tokens_out")
+                ))
+                
         except Exception as e:
             logger.error(f"[ChatRouter] Error streaming message: {str(e)}")
             yield f"Error: {str(e)}"
+        
+        finally:
+            self._release()
+    
+    async def _dispatch(
+        self,
+        routing_profile: str,
+        message: str,
+        messages: List[Dict[str, str]],
+        model_id: Optional[str],
+        user_id: Optional[str],
+        use_tools: bool,
+        metadata: Optional[Dict[str, Any]],
+        connection: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Send already-built messages to the handler for a routing profile."""
+        if routing_profile == "direct_llm":
+            return await self._route_direct_llm(messages, model_id, metadata, connection)
+        if routing_profile == "tools_data":
+            return await self._route_tools_data(message, user_id, use_tools, metadata)
+        raise ValueError(f"Unknown routing profile: {routing_profile}")
     
     async def _build_messages(
         self,
@@ -296,15 +523,27 @@ class ChatRouter:
         system_prompt: Optional[str] = None
     ) -> List[Dict[str, str]]:
         """Build messages list with optional memory and system prompt."""
+        context = await self.conversation_memory.get_context(user_id) if use_memory else None
+        return self._assemble_messages(message, system_prompt, context)
+    
+    @staticmethod
+    def _assemble_messages(
+        message: str,
+        system_prompt: Optional[str] = None,
+        context: Optional[List[Dict[str, str]]] = None
+    ) -> List[Dict[str, str]]:
+        """Combine system prompt, conversation context and the current message."""
+        if not system_prompt and not context:
+            return [{"role": "user", "content": message}]
+        
         messages = []
         
         # Add system prompt if provided
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         
-        # Add conversation history if memory is enabled
-        if use_memory:
-            context = await self.conversation_memory.get_context(user_id)
+        # Add conversation history
+        if context:
             messages.extend(context)
         
         # Add current message
@@ -316,18 +555,71 @@ class ChatRouter:
         self,
         messages: List[Dict[str, str]],
         model_id: Optional[str],
-        metadata: Optional[Dict[str, Any]]
+        metadata: Optional[Dict[str, Any]],
+        connection: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Route directly to LLM."""
+        """Route directly to LLM, using a pre-selected connection when given."""
         logger.info("[ChatRouter] Routing to direct LLM")
         
-        sel = self._select_connection_for_model(model_id)
-        tmp_settings = self._make_temp_settings(sel["base_url"], sel.get("api_key"))
-        client = LLMClient(tmp_settings)
-        try:
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = (model_id, tuple((m["role"], m["content"]) for m in messages))
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("[ChatRouter] Response cache hit")
+                return {
+                    **cached,
+                    "metadata": {**cached["metadata"], "cache": "exact"},
+                    "tokens_in": None,
+                    "tokens_out": None
+                }
+        
+        if cache_key is None:
+            return await self._call_direct_llm(messages, model_id, connection)
+        
+        # Identical prompts already in flight share one upstream call. The call
+        # runs as its own task so a disconnecting caller cannot cancel it for others.
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            logger.debug("[ChatRouter] Joining in-flight LLM call")
+            response = await asyncio.shield(task)
+            return {
+                **response,
+                "metadata": {**response["metadata"], "cache": "coalesced"},
+                "tokens_in": None,
+                "tokens_out": None
+            }
+        
+        task = asyncio.ensure_future(self._call_and_cache(cache_key, messages, model_id, connection))
+        self._inflight[cache_key] = task
+        task.add_done_callback(lambda t, key=cache_key: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+    
+    async def _call_and_cache(
+        self,
+        cache_key: Hashable,
+        messages: List[Dict[str, str]],
+        model_id: Optional[str],
+        connection: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Call the LLM and remember the response for repeated prompts."""
+        response = await self._call_direct_llm(messages, model_id, connection)
+        # Only cache real answers; an empty reply may be a transient backend issue
+        if response["answer"] != "No response generated":
+            self._response_cache.set(cache_key, response)
+        return response
+    
+    async def _call_direct_llm(
+        self,
+        messages: List[Dict[str, str]],
+        model_id: Optional[str],
+        connection: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Call the LLM selected for the model and normalize its response."""
+        sel = connection or self._select_connection_for_model(model_id)
+        client = self._get_or_create_client(sel["base_url"], sel.get("api_key"))
+        async with self._get_semaphore(sel["base_url"], sel.get("api_key")):
             result = await client.call(messages=messages, model=model_id)
-        finally:
-            await client.close()
         
         # Extract response - handle both Ollama and OpenAI formats
         response_data = result.get("response", {})
@@ -376,39 +668,137 @@ class ChatRouter:
             metadata=metadata or {}
         )
         
-        # Execute orchestration graph
-        graph = OrchestrationGraph(self.settings)
+        # Execute orchestration graph (construction never awaits, so no lock is needed)
+        if self._graph is None:
+            self._graph = OrchestrationGraph(self.settings)
+        final_state = await self._graph.execute(state)
+        
+        return {
+            "answer": final_state.answer or "No response generated",
+            "metadata": {
+                "routing_profile": "tools_data",
+                "execution_id": final_state.execution_id,
+                "tools_used": final_state.final_metadata.get("tools_used", []),
+                **final_state.final_metadata
+            },
+            "error": final_state.error
+        }
+    
+    async def _store_metric(self, metric: MetricRecord) -> None:
+        """Queue a chat metric for background persistence."""
+        if self._metric_worker is None or self._metric_worker.done():
+            if self._metric_queue is None:
+                self._metric_queue = asyncio.Queue(maxsize=_METRIC_QUEUE_SIZE)
+            self._metric_worker = asyncio.create_task(self._run_metric_worker())
+        
         try:
-            final_state = await graph.execute(state)
+            self._metric_queue.put_nowait(metric)
+        except asyncio.QueueFull:
+            logger.warning("[ChatRouter] Metric queue full, dropping metric")
+    
+    async def _run_metric_worker(self) -> None:
+        """Drain the metric queue, writing batches without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._metric_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            deadline = loop.time() + _METRIC_BATCH_WAIT_SECONDS
+            while len(batch) < _METRIC_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._metric_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
             
-            return {
-                "answer": final_state.answer or "No response generated",
-                "metadata": {
-                    "routing_profile": "tools_data",
-                    "execution_id": final_state.execution_id,
-                    "tools_used": final_state.final_metadata.get("tools_used", []),
-                    **final_state.final_metadata
-                },
-                "error": final_state.error
-            }
-        finally:
-            await graph.close()
+            try:
+                if database.AsyncSessionLocal is not None:
+                    async with database.get_async_db() as session:
+                        session.add_all([metric.to_model() for metric in batch])
+                        await session.commit()
+                else:
+                    await asyncio.to_thread(self._write_metrics, batch)
+                logger.debug(f"[ChatRouter] Stored {len(batch)} metrics")
+            except Exception as e:
+                logger.error(f"[ChatRouter] Error storing metrics: {str(e)}")
+            if stop:
+                return
     
-    async def _store_metric(self, metric_data: Dict[str, Any]) -> None:
-        """Store chat metric in database."""
+    def _write_metrics(self, batch: List[MetricRecord]) -> None:
+        """Insert a batch of chat metrics with a single commit."""
+        db = database.SessionLocal()
         try:
-            db = next(get_db())
-            # Rename 'metadata' to 'metric_metadata' for SQLAlchemy compatibility
-            if 'metadata' in metric_data:
-                metric_data['metric_metadata'] = metric_data.pop('metadata')
-            metric = ChatMetric(**metric_data)
-            db.add(metric)
+            db.add_all([metric.to_model() for metric in batch])
             db.commit()
-            logger.debug(f"[ChatRouter] Stored metric: {metric.id}")
-        except Exception as e:
-            logger.error(f"[ChatRouter] Error storing metric: {str(e)}")
+        finally:
+            db.close()
     
     async def close(self):
         """Close all clients."""
+        if self._closed:
+            return
+        self._closed = True
+        _retired_routers.discard(self)
+        if self._close_task is not None:
+            self._close_task.cancel()
+            self._close_task = None
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        if self._metric_worker is not None and not self._metric_worker.done():
+            # Sentinel lets the worker flush what is already queued
+            await self._metric_queue.put(None)
+            await self._metric_worker
         await self.llm_client.close()
+        if self._graph is not None:
+            await self._graph.close()
+            self._graph = None
+        for client in self._client_cache.values():
+            await client.close()
+        self._client_cache.clear()
         await self.conversation_memory.close()
+
+
+_shared_router: Optional[ChatRouter] = None
+# Superseded routers still draining requests, closed at shutdown if pending
+_retired_routers: Set[ChatRouter] = set()
+
+
+def get_chat_router(settings: Settings) -> ChatRouter:
+    """
+    Get the process-wide ChatRouter for the given settings.
+    
+    The router is rebuilt when settings are reloaded so connection changes
+    take effect; the superseded router finishes its in-flight requests and
+    then closes its clients.
+    
+    Args:
+        settings: Application settings
+        
+    Returns:
+        Shared ChatRouter instance
+    """
+    global _shared_router
+    if _shared_router is None or _shared_router.settings is not settings:
+        if _shared_router is not None:
+            _retired_routers.add(_shared_router)
+            _shared_router.retire()
+        _shared_router = ChatRouter(settings)
+    return _shared_router
+
+
+async def close_chat_router() -> None:
+    """Close the shared ChatRouter, if one was created, and any superseded ones."""
+    global _shared_router
+    for retired in list(_retired_routers):
+        await retired.close()
+    if _shared_router is not None:
+        await _shared_router.close()
+        _shared_router = None
@@ -4,14 +4,56 @@ Configuration File Writer Service.
 Handles writing configuration changes from GUI to persistent files.
 """
 
-import json
+import asyncio
+import copy
 import logging
 import os
-from typing import Dict, Any, Optional
+import re
+import shutil
+import threading
+from typing import Dict, Any, Optional, Set, Tuple
 from pathlib import Path
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for config writes; payloads go out in a single write call
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# One KEY=VALUE line of a .env file; '#' lines are skipped and key/value are
+# stripped. A double-quoted value is captured unquoted so it is not quoted twice.
+_ENV_LINE_RE = re.compile(
+    r'^[^\S\n]*(?![#\s])([^=\n]*?)[^\S\n]*=[^\S\n]*(?:"(.*)"|(.*?))[^\S\n]*$',
+    re.MULTILINE
+)
+
+# Header written at the top of every generated .env file
+_ENV_HEADER = "# AI Orchestrator Studio Configuration\n# Auto-generated from GUI\n\n"
+
+# Characters that force a .env value to be double-quoted
+_QUOTE_RE = re.compile(r"[ #$&]")
+
+# Linux ioctl asking the filesystem to share src's extents with dst (reflink)
+_FICLONE = 0x40049409
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a file, as an O(1) reflink on copy-on-write filesystems."""
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+    # Uses in-kernel sendfile on Linux
+    shutil.copyfile(src, dst)
+
 
 class ConfigWriter:
     """Service for writing configuration to files."""
@@ -26,6 +68,76 @@ class ConfigWriter:
         self.base_path = Path(base_path)
         self.config_dir = self.base_path / "backend" / "orchestrator" / "config"
         self.env_file = self.base_path / "backend" / "orchestrator" / ".env"
+        # Parsed JSON configs by filename, valid while (mtime_ns, size) matches
+        self._json_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        # Directories already created/verified, so writes skip mkdir
+        self._ready_dirs: Set[Path] = set()
+        # Serializes file updates (the .env read-merge-write, JSON writes and
+        # backups), since the async entrypoints run them in threads.
+        # Reentrant: write_env_file holds it around _write_in_dir
+        self._write_lock = threading.RLock()
+    
+    @staticmethod
+    def _write_if_changed(filepath: Path, payload: bytes) -> bool:
+        """
+        Write payload to a file unless it already holds exactly these bytes.
+        
+        The payload goes to a temporary file in the same directory which is
+        then renamed over the target, so readers never see a partial file.
+        
+        Args:
+            filepath: Target file
+            payload: Complete serialized contents
+            
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        mode = None
+        try:
+            st = filepath.stat()
+            # Only read the old contents back when the sizes already match
+            if st.st_size == len(payload) and filepath.read_bytes() == payload:
+                return False
+            mode = st.st_mode
+        except FileNotFoundError:
+            pass
+        
+        tmp = filepath.with_suffix(filepath.suffix + '.tmp')
+        try:
+            with open(tmp, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(payload)
+            # Keep the original permissions (e.g. a 0600 .env)
+            if mode is not None:
+                os.chmod(tmp, mode)
+            os.replace(tmp, filepath)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return True
+    
+    def _write_in_dir(self, filepath: Path, payload: bytes) -> bool:
+        """
+        Write via _write_if_changed, creating the parent directory if needed.
+        
+        Each directory is created once per writer; if it disappears later
+        (e.g. removed by hand) it is recreated and the write retried.
+        
+        Args:
+            filepath: Target file
+            payload: Complete serialized contents
+            
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        with self._write_lock:
+            if filepath.parent not in self._ready_dirs:
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                self._ready_dirs.add(filepath.parent)
+            try:
+                return self._write_if_changed(filepath, payload)
+            except FileNotFoundError:
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                return self._write_if_changed(filepath, payload)
         
     def write_env_file(self, config: Dict[str, Any]) -> bool:
         """
@@ -38,32 +150,35 @@ class ConfigWriter:
             True if successful, False otherwise
         """
         try:
-            # Read existing .env file if it exists
-            existing_config = {}
-            if self.env_file.exists():
-                with open(self.env_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            existing_config[key.strip()] = value.strip()
-            
-            # Update with new config
-            existing_config.update(config)
-            
-            # Write back to file
-            with open(self.env_file, 'w') as f:
-                f.write("# AI Orchestrator Studio Configuration\n")
-                f.write("# Auto-generated from GUI\n\n")
+            # Hold the lock from read to write so concurrent updates cannot
+            # drop each other's keys
+            with self._write_lock:
+                # Read existing .env file if it exists
+                existing_config = {}
+                if self.env_file.exists():
+                    existing_config = {
+                        key: quoted or value
+                        for key, quoted, value in _ENV_LINE_RE.findall(self.env_file.read_text())
+                    }
                 
-                for key, value in sorted(existing_config.items()):
-                    # Handle values with spaces or special characters
-                    if isinstance(value, str) and (' ' in value or any(c in value for c in ['#', '$', '&'])):
-                        value = f'"{value}"'
-                    f.write(f"{key}={value}\n")
-            
-            logger.info(f"Successfully wrote {len(config)} variables to .env file")
-            return True
+                # Update with new config
+                existing_config.update(config)
+                
+                # Serialize in memory so an unchanged file is left untouched;
+                # values with spaces or special characters are quoted
+                lines = [
+                    f'{key}="{value}"\n' if isinstance(value, str) and _QUOTE_RE.search(value)
+                    else f"{key}={value}\n"
+                    for key, value in sorted(existing_config.items())
+                ]
+                payload = _ENV_HEADER + "".join(lines)
+                
+                if not self._write_in_dir(self.env_file, payload.encode()):
+                    logger.info(".env file unchanged, skipping write")
+                    return True
+                
+                logger.info(f"Successfully wrote {len(config)} variables to .env file")
+                return True
             
         except Exception as e:
             logger.error(f"Error writing .env file: {str(e)}")
@@ -81,14 +196,14 @@ class ConfigWriter:
             True if successful, False otherwise
         """
         try:
-            # Ensure config directory exists
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-            
             filepath = self.config_dir / filename
             
-            # Write JSON with pretty formatting
-            with open(filepath, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write JSON with pretty formatting, skipping identical contents
+            self._json_cache.pop(filename, None)
+            payload = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            if not self._write_in_dir(filepath, payload):
+                logger.info(f"{filename} unchanged, skipping write")
+                return True
             
             logger.info(f"Successfully wrote configuration to {filename}")
             return True
@@ -97,6 +212,43 @@ class ConfigWriter:
             logger.error(f"Error writing {filename}: {str(e)}")
             return False
     
+    async def awrite_env_file(self, config: Dict[str, Any]) -> bool:
+        """
+        Write configuration to .env file without blocking the event loop.
+        
+        Args:
+            config: Dictionary of environment variables
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await asyncio.to_thread(self.write_env_file, config)
+    
+    async def awrite_json_config(self, filename: str, config: Dict[str, Any]) -> bool:
+        """
+        Write configuration to JSON file without blocking the event loop.
+        
+        Args:
+            filename: Name of the JSON file (e.g., 'agents.json')
+            config: Configuration dictionary
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await asyncio.to_thread(self.write_json_config, filename, config)
+    
+    async def abackup_config(self, filename: str) -> bool:
+        """
+        Create a backup of a configuration file without blocking the event loop.
+        
+        Args:
+            filename: Name of the file to backup
+            
+        Returns:
+            True if successful
+        """
+        return await asyncio.to_thread(self.backup_config, filename)
+    
     def write_agents_config(self, agents: list) -> bool:
         """
         Write agents configuration.
@@ -149,12 +301,21 @@ class ConfigWriter:
         try:
             filepath = self.config_dir / filename
             
-            if not filepath.exists():
+            try:
+                st = filepath.stat()
+            except FileNotFoundError:
                 logger.warning(f"Config file {filename} does not exist")
                 return None
             
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            # Reuse the parsed config while the file is unchanged; callers get
+            # their own copy so the cached one is never mutated
+            version = (st.st_mtime_ns, st.st_size)
+            cached = self._json_cache.get(filename)
+            if cached is None or cached[0] != version:
+                cached = (version, orjson.loads(filepath.read_bytes()))
+                self._json_cache[filename] = cached
+            
+            return copy.deepcopy(cached[1])
                 
         except Exception as e:
             logger.error(f"Error reading {filename}: {str(e)}")
@@ -178,8 +339,14 @@ class ConfigWriter:
             
             backup_path = filepath.with_suffix(filepath.suffix + '.backup')
             
-            import shutil
-            shutil.copy2(filepath, backup_path)
+            # Not interleaved with a write replacing the file being copied
+            with self._write_lock:
+                _copy_file(filepath, backup_path)
+                # Keep the original permissions (a backup of .env must stay private)
+                # and timestamps, so the backup shows when the config last changed
+                st = filepath.stat()
+                os.chmod(backup_path, st.st_mode)
+                os.utime(backup_path, ns=(st.st_atime_ns, st.st_mtime_ns))
             
             logger.info(f"Created backup: {backup_path}")
             return True
@@ -11,9 +11,11 @@ Security Rules:
 """
 
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from sqlalchemy.orm import Session
+import re
+import threading
+import time
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy.exc import IntegrityError
 
 from ..db.models import Credential
@@ -26,6 +28,80 @@ from ..security.credentials import (
 
 logger = logging.getLogger(__name__)
 
+# Keys that must never appear in credential extra metadata
+_SENSITIVE_RE = re.compile(r"password|secret|token|key|credential", re.IGNORECASE)
+
+# Appended to invalid credential type errors
+_VALID_TYPES_MSG = "Valid types: ssh, http_basic, bearer_token, db_dsn, api_key, custom"
+
+# Seconds a decrypted credential may be served from memory
+_DECRYPTED_CACHE_TTL_SECONDS = 30.0
+
+# credential_id -> (monotonic timestamp, metadata, secret bytes)
+_decrypted_cache: Dict[str, Tuple[float, Dict[str, Any], bytearray]] = {}
+_decrypted_cache_lock = threading.Lock()
+
+
+def _wipe_cached_secret(entry: Tuple[float, Dict[str, Any], bytearray]) -> None:
+    """Zero the secret buffer of an evicted cache entry."""
+    secret = entry[2]
+    secret[:] = bytes(len(secret))
+
+
+def _get_cached_credential(credential_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a decrypted credential from the TTL cache.
+    
+    Args:
+        credential_id: Credential ID
+        
+    Returns:
+        Fresh copy of the cached credential, or None on miss/expiry
+    """
+    with _decrypted_cache_lock:
+        entry = _decrypted_cache.get(credential_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= _DECRYPTED_CACHE_TTL_SECONDS:
+            del _decrypted_cache[credential_id]
+            _wipe_cached_secret(entry)
+            return None
+        result = dict(entry[1])
+        result["extra"] = dict(result["extra"])
+        result["secret"] = entry[2].decode("utf-8")
+        return result
+
+
+def _cache_credential(credential_id: str, payload: Dict[str, Any]) -> None:
+    """
+    Store a decrypted credential in the TTL cache.
+    
+    Args:
+        credential_id: Credential ID
+        payload: Credential data as returned by get_credential_for_use
+    """
+    metadata = {k: v for k, v in payload.items() if k != "secret"}
+    metadata["extra"] = dict(metadata["extra"])
+    entry = (time.monotonic(), metadata, bytearray(payload["secret"].encode("utf-8")))
+    with _decrypted_cache_lock:
+        previous = _decrypted_cache.get(credential_id)
+        _decrypted_cache[credential_id] = entry
+    if previous is not None:
+        _wipe_cached_secret(previous)
+
+
+def _evict_cached_credential(credential_id: str) -> None:
+    """
+    Drop a credential from the TTL cache and wipe its secret.
+    
+    Args:
+        credential_id: Credential ID
+    """
+    with _decrypted_cache_lock:
+        entry = _decrypted_cache.pop(credential_id, None)
+    if entry is not None:
+        _wipe_cached_secret(entry)
+
 
 class CredentialNotFoundError(Exception):
     """Exception raised when credential is not found."""
@@ -37,6 +113,19 @@ class CredentialValidationError(Exception):
     pass
 
 
+def _check_sensitive(extra: Dict[str, Any]) -> List[str]:
+    """
+    Find extra metadata keys that look like secrets.
+    
+    Args:
+        extra: Credential metadata
+        
+    Returns:
+        Keys matching _SENSITIVE_RE (empty if none)
+    """
+    return [k for k in extra if _SENSITIVE_RE.search(k)]
+
+
 class CredentialsService:
     """
     Service for managing credentials.
@@ -88,8 +177,7 @@ class CredentialsService:
         
         if not cred_type or not validate_credential_type(cred_type):
             raise CredentialValidationError(
-                f"Invalid credential type: {cred_type}. "
-                f"Valid types: ssh, http_basic, bearer_token, db_dsn, api_key, custom"
+                f"Invalid credential type: {cred_type}. {_VALID_TYPES_MSG}"
             )
         
         if not secret or not secret.strip():
@@ -97,8 +185,7 @@ class CredentialsService:
         
         # Validate extra doesn't contain sensitive keys
         if extra:
-            sensitive_keys = {"password", "secret", "token", "key", "credential"}
-            found_sensitive = [k for k in extra.keys() if any(s in k.lower() for s in sensitive_keys)]
+            found_sensitive = _check_sensitive(extra)
             if found_sensitive:
                 raise CredentialValidationError(
                     f"Extra metadata must not contain sensitive keys: {found_sensitive}"
@@ -155,13 +242,37 @@ class CredentialsService:
         Security:
             - Returns metadata only, never the secret
         """
-        credential = self.db.query(Credential).filter(Credential.id == credential_id).first()
+        # Session.get serves rows already loaded in this session without a query
+        credential = self.db.get(Credential, credential_id)
         
         if not credential:
             raise CredentialNotFoundError(f"Credential not found: {credential_id}")
         
         return credential.to_safe_dict()
     
+    def get_credentials_by_ids(self, credential_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata for several credentials in a single query.
+        
+        Args:
+            credential_ids: Credential IDs
+            
+        Returns:
+            Mapping of credential ID to metadata (without secret); unknown
+            IDs are omitted
+            
+        Security:
+            - Returns metadata only, never secrets
+        """
+        if not credential_ids:
+            return {}
+        
+        credentials = self.db.query(Credential).filter(
+            Credential.id.in_(set(credential_ids))
+        ).all()
+        
+        return {cred.id: cred.to_safe_dict() for cred in credentials}
+    
     def get_credential_by_name(self, name: str) -> Dict[str, Any]:
         """
         Get credential metadata by name.
@@ -203,7 +314,19 @@ class CredentialsService:
         Security:
             - Returns metadata only, never secrets
         """
-        query = self.db.query(Credential)
+        # Skip the encrypted secret column; to_safe_dict never reads it
+        query = self.db.query(Credential).options(
+            load_only(
+                Credential.id,
+                Credential.name,
+                Credential.type,
+                Credential.username,
+                Credential.extra,
+                Credential.is_active,
+                Credential.created_at,
+                Credential.updated_at
+            )
+        )
         
         if cred_type:
             query = query.filter(Credential.type == cred_type)
@@ -211,9 +334,9 @@ class CredentialsService:
         if active_only:
             query = query.filter(Credential.is_active == True)
         
-        credentials = query.order_by(Credential.created_at.desc()).all()
+        query = query.order_by(Credential.created_at.desc())
         
-        return [cred.to_safe_dict() for cred in credentials]
+        return [cred.to_safe_dict() for cred in query]
     
     def update_credential(
         self,
@@ -246,7 +369,7 @@ class CredentialsService:
             - If secret is provided, it's encrypted before storage
             - Returns metadata only, never the secret
         """
-        credential = self.db.query(Credential).filter(Credential.id == credential_id).first()
+        credential = self.db.get(Credential, credential_id)
         
         if not credential:
             raise CredentialNotFoundError(f"Credential not found: {credential_id}")
@@ -270,8 +393,7 @@ class CredentialsService:
             
             if extra is not None:
                 # Validate extra doesn't contain sensitive keys
-                sensitive_keys = {"password", "secret", "token", "key", "credential"}
-                found_sensitive = [k for k in extra.keys() if any(s in k.lower() for s in sensitive_keys)]
+                found_sensitive = _check_sensitive(extra)
                 if found_sensitive:
                     raise CredentialValidationError(
                         f"Extra metadata must not contain sensitive keys: {found_sensitive}"
@@ -281,10 +403,9 @@ class CredentialsService:
             if is_active is not None:
                 credential.is_active = is_active
             
-            credential.updated_at = datetime.utcnow()
-            
             self.db.commit()
             self.db.refresh(credential)
+            _evict_cached_credential(credential_id)
             
             logger.info(f"Updated credential: {credential.name}")
             
@@ -314,16 +435,16 @@ class CredentialsService:
         Raises:
             CredentialNotFoundError: If credential not found
         """
-        credential = self.db.query(Credential).filter(Credential.id == credential_id).first()
+        credential = self.db.get(Credential, credential_id)
         
         if not credential:
             raise CredentialNotFoundError(f"Credential not found: {credential_id}")
         
         # Soft delete
         credential.is_active = False
-        credential.updated_at = datetime.utcnow()
         
         self.db.commit()
+        _evict_cached_credential(credential_id)
         
         logger.info(f"Deactivated credential: {credential.name}")
         
@@ -353,13 +474,21 @@ class CredentialsService:
         Warning:
             This is a security-sensitive method. The decrypted secret
             exists in memory and must be handled with extreme care.
+            
+            Decrypted results are cached in process memory for
+            _DECRYPTED_CACHE_TTL_SECONDS so repeated tool calls skip the
+            query and the decryption. This trades a short window of
+            in-memory exposure for latency: cached secrets are held as
+            bytes and zeroed on eviction, and entries are dropped as soon
+            as the credential is updated or deleted through this service.
         """
-        credential = self.db.query(Credential).filter(
-            Credential.id == credential_id,
-            Credential.is_active == True
-        ).first()
+        cached = _get_cached_credential(credential_id)
+        if cached is not None:
+            return cached
         
-        if not credential:
+        credential = self.db.get(Credential, credential_id)
+        
+        if not credential or not credential.is_active:
             raise CredentialNotFoundError(f"Active credential not found: {credential_id}")
         
         try:
@@ -368,7 +497,7 @@ class CredentialsService:
             
             # Return credential data with decrypted secret
             # WARNING: This contains sensitive data!
-            return {
+            result = {
                 "id": credential.id,
                 "name": credential.name,
                 "type": credential.type,
@@ -376,6 +505,8 @@ class CredentialsService:
                 "secret": decrypted_secret,  # DECRYPTED - Handle with care!
                 "extra": credential.extra or {}
             }
+            _cache_credential(credential_id, result)
+            return result
             
         except CredentialEncryptionError:
             logger.error(f"Failed to decrypt credential: {credential.name}")
@@ -9,6 +9,8 @@ from typing import Any, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from ..compat import DATACLASS_OPTIONS
+
 
 class ToolStatus(Enum):
     """Tool execution status."""
@@ -18,7 +20,11 @@ class ToolStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Status serialization without the Enum.value descriptor lookup
+_STATUS_STR = {status: status.value for status in ToolStatus}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ToolResult:
     """
     Result of tool execution.
@@ -41,7 +47,7 @@ class ToolResult:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "status": self.status.value,
+            "status": _STATUS_STR[self.status],
             "output": self.output,
             "error": self.error,
             "metadata": self.metadata or {}
@@ -67,6 +73,17 @@ class BaseTool(ABC):
         self.name = name
         self.description = description
         self.config = config or {}
+        self._schema_cache: Optional[Dict[str, Any]] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        """
+        Allow tools to be called directly.
+        
+        Binds __call__ to the subclass's execute so `await tool(**kwargs)`
+        runs execute without an extra coroutine wrapper.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.__call__ = cls.execute
     
     @abstractmethod
     async def execute(self, **kwargs) -> ToolResult:
@@ -82,14 +99,28 @@ class BaseTool(ABC):
         pass
     
     @abstractmethod
+    def _build_schema(self) -> Dict[str, Any]:
+        """
+        Build tool schema for LLM function calling.
+        
+        Returns:
+            JSON schema describing tool parameters
+        """
+        pass
+    
     def get_schema(self) -> Dict[str, Any]:
         """
         Get tool schema for LLM function calling.
         
+        The schema only depends on settings fixed at init, so it is built
+        once and reused; treat the returned dict as read-only.
+        
         Returns:
             JSON schema describing tool parameters
         """
-        pass
+        if self._schema_cache is None:
+            self._schema_cache = self._build_schema()
+        return self._schema_cache
     
     def validate_params(self, params: Dict[str, Any]) -> bool:
         """
@@ -104,9 +135,14 @@ class BaseTool(ABC):
         # Default implementation - override for custom validation
         return True
     
-    async def __call__(self, **kwargs) -> ToolResult:
-        """Allow tool to be called directly."""
-        return await self.execute(**kwargs)
+    async def aclose(self) -> None:
+        """
+        Release resources held by the tool (e.g. pooled HTTP connections).
+        
+        Default implementation does nothing; override in tools that keep
+        long-lived clients.
+        """
+        pass
     
     def __repr__(self) -> str:
         """String representation."""
@@ -6,11 +6,371 @@ Uses configuration from tool config - no hard-coded settings.
 
 import logging
 import asyncio
-from typing import Dict, Any, Optional
+import ast
+import builtins
+import io
+import struct
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from types import CodeType
+from typing import Awaitable, Dict, Any, Optional, Set, Tuple
+import orjson
 from .base import BaseTool, ToolResult, ToolStatus
 
 logger = logging.getLogger(__name__)
 
+# Length prefix framing the worker protocol (see python_worker.py)
+_HEADER = struct.Struct(">I")
+_PYTHON_WORKER = str(Path(__file__).with_name("python_worker.py"))
+_NODE_WORKER = str(Path(__file__).with_name("node_worker.js"))
+
+# asyncio.timeout (3.11+) bounds an await without wrapping it in a new Task
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
+
+async def _bounded(coro: Awaitable[Any], timeout: float) -> Any:
+    """
+    Await coro, raising asyncio.TimeoutError after timeout seconds.
+    
+    Args:
+        coro: Coroutine to await
+        timeout: Seconds allowed
+        
+    Returns:
+        Result of coro
+    """
+    if _asyncio_timeout is not None:
+        async with _asyncio_timeout(timeout):
+            return await coro
+    return await asyncio.wait_for(coro, timeout=timeout)
+
+
+# Builtins visible to inline snippets; no imports, file or attribute access
+_INLINE_ALLOWED_BUILTINS = frozenset({
+    "abs", "all", "any", "bool", "dict", "divmod", "enumerate", "filter",
+    "float", "int", "isinstance", "len", "list", "map", "max", "min", "print",
+    "range", "reversed", "round", "set", "sorted", "str", "sum", "tuple", "zip"
+})
+
+
+class _InlineTimeout(BaseException):
+    """Raised inside an inline snippet once its deadline has passed."""
+
+
+class _CappedWriter:
+    """Text sink that keeps at most max_bytes of UTF-8 output."""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.truncated = False
+        self._chunks = []
+    
+    def write(self, text: str) -> int:
+        if self.size > self.max_bytes:
+            self.truncated = True
+            return len(text)
+        self._chunks.append(text)
+        self.size += len(text.encode("utf-8", "replace"))
+        return len(text)
+    
+    def flush(self) -> None:
+        pass
+    
+    def getvalue(self) -> str:
+        data = "".join(self._chunks).encode("utf-8", "replace")
+        if len(data) > self.max_bytes:
+            self.truncated = True
+            data = data[:self.max_bytes]
+        return data.decode("utf-8", "ignore")
+
+
+@lru_cache(maxsize=256)
+def _compile_inline(code: str) -> Optional[CodeType]:
+    """
+    Compile a snippet for inline execution.
+    
+    Args:
+        code: Python source
+        
+    Returns:
+        Code object, or None if the snippet needs a real interpreter
+        (syntax errors, imports, dunder names, builtins outside
+        _INLINE_ALLOWED_BUILTINS, or bare except clauses, which could
+        swallow the timeout)
+    """
+    try:
+        tree = ast.parse(code, "<string>", "exec")
+    except (SyntaxError, ValueError):
+        return None
+    assigned = set()
+    loaded = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            return None
+        if isinstance(node, ast.ExceptHandler) and node.type is None:
+            return None
+        name = node.id if isinstance(node, ast.Name) else node.attr if isinstance(node, ast.Attribute) else None
+        if name is not None and name.startswith("__"):
+            return None
+        if isinstance(node, ast.Name):
+            (loaded if isinstance(node.ctx, ast.Load) else assigned).add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            assigned.add(node.name)
+        elif isinstance(node, ast.arg):
+            assigned.add(node.arg)
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            assigned.add(node.name)
+        else:
+            # match-statement captures (MatchAs/MatchStar name, MatchMapping rest)
+            for field in ("name", "rest"):
+                value = getattr(node, field, None)
+                if isinstance(value, str):
+                    assigned.add(value)
+    # Names the snippet never binds resolve to builtins; any builtin the
+    # restricted namespace lacks would fail with NameError inline
+    if loaded - assigned - _INLINE_ALLOWED_BUILTINS - {"input"}:
+        return None
+    return compile(tree, "<string>", "exec")
+
+
+def _run_inline(code: CodeType, stdin: Optional[str], timeout: float, max_output: int) -> Tuple[str, str, int, bool]:
+    """
+    Run a compiled snippet with restricted builtins on the current thread.
+    
+    Threads cannot be interrupted by signals, so the deadline is checked
+    from a per-opcode trace function. That makes each operation slower
+    than in a subprocess; inline mode pays off for short snippets only.
+    A single long-running builtin call (e.g. sum over a huge range) is not
+    interrupted and holds the GIL, stalling the event loop until it ends.
+    
+    Args:
+        code: Code object from _compile_inline
+        stdin: Text served to input()
+        timeout: Seconds allowed
+        max_output: Per-stream cap on captured output in bytes
+        
+    Returns:
+        (stdout, stderr, return_code, truncated)
+        
+    Raises:
+        asyncio.TimeoutError: If the snippet ran past the deadline
+    """
+    out = _CappedWriter(max_output)
+    err = _CappedWriter(max_output)
+    lines = io.StringIO(stdin or "")
+    
+    def _print(*args, sep=" ", end="\n", file=None, flush=False):
+        print(*args, sep=sep, end=end, file=out if file is None else file)
+    
+    def _input(prompt=""):
+        out.write(str(prompt))
+        line = lines.readline()
+        if not line:
+            raise EOFError("EOF when reading a line")
+        return line.rstrip("\n")
+    
+    allowed = {name: getattr(builtins, name) for name in _INLINE_ALLOWED_BUILTINS}
+    allowed["print"] = _print
+    allowed["input"] = _input
+    
+    deadline = time.monotonic() + timeout
+    
+    def _check_deadline(frame, event, arg):
+        if event == "call":
+            # Line events alone miss loops written on a single line
+            frame.f_trace_opcodes = True
+        if time.monotonic() > deadline:
+            raise _InlineTimeout()
+        return _check_deadline
+    
+    return_code = 0
+    sys.settrace(_check_deadline)
+    try:
+        exec(code, {"__name__": "__main__", "__builtins__": allowed})
+    except _InlineTimeout:
+        raise asyncio.TimeoutError()
+    except Exception:
+        # An except clause naming an unavailable exception class turns the
+        # timeout into a NameError
+        if time.monotonic() > deadline:
+            raise asyncio.TimeoutError()
+        exc_type, exc, tb = sys.exc_info()
+        # Drop this function's frame so the traceback matches `python -c`
+        err.write("".join(traceback.format_exception(exc_type, exc, tb.tb_next)))
+        return_code = 1
+    finally:
+        sys.settrace(None)
+    return out.getvalue(), err.getvalue(), return_code, out.truncated or err.truncated
+
+
+class _WorkerPool:
+    """
+    Pool of warm interpreters running a worker driver script.
+    
+    Each snippet is sent to an idle worker over stdin instead of starting a
+    new interpreter. Workers are spawned on demand, retired after max_runs
+    snippets so state left behind by snippets does not accumulate, and
+    killed when a snippet times out. Retired and killed workers are replaced
+    in the background, so the next snippet does not pay for the spawn.
+    """
+    
+    def __init__(self, command: Tuple[str, ...], size: int, max_runs: int):
+        """
+        Initialize worker pool.
+        
+        Args:
+            command: Worker command line (interpreter and driver script)
+            size: Maximum number of concurrent workers
+            max_runs: Snippets a worker runs before it is replaced
+        """
+        self.command = command
+        self.size = size
+        self.max_runs = max_runs
+        # Idle slots: (process, runs) or None for a not-yet-spawned worker
+        self._idle: Optional[asyncio.Queue] = None
+        self._processes: Set[asyncio.subprocess.Process] = set()
+        self._replacing: Set[asyncio.Task] = set()
+    
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        """Start a worker process."""
+        process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        self._processes.add(process)
+        return process
+    
+    async def _discard(self, process: asyncio.subprocess.Process, kill: bool) -> None:
+        """
+        Stop a worker and reap it.
+        
+        Args:
+            process: Worker process
+            kill: Kill immediately instead of letting it exit on EOF
+        """
+        self._processes.discard(process)
+        if process.returncode is None:
+            if kill:
+                process.kill()
+            else:
+                process.stdin.close()
+        await process.wait()
+    
+    async def _replace(
+        self,
+        idle: asyncio.Queue,
+        process: asyncio.subprocess.Process,
+        kill: bool
+    ) -> None:
+        """
+        Stop a worker and refill its slot with a fresh one.
+        
+        Args:
+            idle: Idle queue the slot belongs to
+            process: Worker being replaced
+            kill: Kill immediately instead of letting it exit on EOF
+        """
+        await self._discard(process, kill)
+        try:
+            replacement = await self._spawn()
+        except Exception:
+            # Leave the slot empty; the next run spawns (and reports errors)
+            idle.put_nowait(None)
+            return
+        if self._idle is not idle:
+            # Pool was closed while spawning
+            await self._discard(replacement, kill=True)
+            return
+        idle.put_nowait((replacement, 0))
+    
+    @staticmethod
+    async def _exchange(process: asyncio.subprocess.Process, payload: bytes) -> Dict[str, Any]:
+        """Send one framed request and read the framed response."""
+        process.stdin.write(_HEADER.pack(len(payload)) + payload)
+        await process.stdin.drain()
+        header = await process.stdout.readexactly(_HEADER.size)
+        return orjson.loads(await process.stdout.readexactly(_HEADER.unpack(header)[0]))
+    
+    async def run(
+        self,
+        code: str,
+        stdin: Optional[str],
+        timeout: float,
+        max_output: int
+    ) -> Tuple[str, str, int, bool]:
+        """
+        Run a snippet on an idle worker.
+        
+        Args:
+            code: Snippet source
+            stdin: Standard input
+            timeout: Seconds allowed for the snippet
+            max_output: Per-stream cap on returned output, in bytes
+            
+        Returns:
+            Tuple of (stdout, stderr, return code, whether output was truncated);
+            if the worker exits mid-snippet, its exit code with empty output
+            
+        Raises:
+            asyncio.TimeoutError: If the snippet exceeds timeout
+            FileNotFoundError: If the interpreter is not installed
+        """
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for _ in range(self.size):
+                self._idle.put_nowait(None)
+        idle = self._idle
+        
+        slot = await idle.get()
+        process, runs = slot if slot is not None else (None, 0)
+        reuse = False
+        try:
+            if process is None or process.returncode is not None:
+                process, runs = await self._spawn(), 0
+            
+            payload = orjson.dumps({"code": code, "stdin": stdin, "max_output": max_output})
+            try:
+                response = await _bounded(self._exchange(process, payload), timeout)
+            except (asyncio.IncompleteReadError, BrokenPipeError, ConnectionResetError):
+                # The snippet took the worker down (e.g. os._exit); report it
+                # like a per-snippet process exiting with that code
+                return_code = await process.wait()
+                return "", "", return_code, False
+            
+            runs += 1
+            reuse = runs < self.max_runs
+            return response["stdout"], response["stderr"], response["rc"], response["truncated"]
+        finally:
+            if reuse:
+                idle.put_nowait((process, runs))
+            elif process is None:
+                idle.put_nowait(None)
+            else:
+                # A worker that did not answer may be mid-snippet: kill it
+                task = asyncio.get_running_loop().create_task(
+                    self._replace(idle, process, kill=runs < self.max_runs)
+                )
+                self._replacing.add(task)
+                task.add_done_callback(self._replacing.discard)
+    
+    async def close(self) -> None:
+        """Stop all workers."""
+        self._idle = None
+        # Pending replacements see the pool is closed and stop their worker
+        await asyncio.gather(*self._replacing, return_exceptions=True)
+        processes = list(self._processes)
+        await asyncio.gather(
+            *(self._discard(process, kill=True) for process in processes),
+            return_exceptions=True
+        )
+
 
 class CodeExecutorTool(BaseTool):
     """
@@ -35,7 +395,38 @@ class CodeExecutorTool(BaseTool):
         
         self.timeout = self.config.get("timeout", 30)
         self.max_memory = self.config.get("max_memory", "512MB")
-        self.allowed_languages = self.config.get("allowed_languages", ["python", "javascript"])
+        allowed = self.config.get("allowed_languages", ("python", "javascript"))
+        # The tools UI stores this field as comma-separated text
+        if isinstance(allowed, str):
+            allowed = [lang.strip() for lang in allowed.split(",") if lang.strip()]
+        self.allowed_languages = frozenset(allowed)
+        # Warm interpreters for Python snippets. Snippets on one worker share
+        # process state (builtins, os.environ, imported modules) until it is
+        # retired, so they are opt-in; 0 starts a process per snippet
+        self.python_workers = self.config.get("python_workers", 0)
+        # Warm Node.js workers run snippets in a fresh vm context but do not
+        # wait for timers/pending I/O like `node -e`, so they are opt-in
+        self.javascript_workers = self.config.get("javascript_workers", 0)
+        self.worker_max_runs = self.config.get("worker_max_runs", 100)
+        # Per-stream cap on captured output; longer output is truncated
+        self.max_output_bytes = self.config.get("max_output_bytes", 1 << 20)
+        # Opt-in: run simple Python snippets in-process with restricted
+        # builtins. Not a security boundary, so only for trusted callers
+        self.inline_python = self.config.get("inline_python", False)
+        self.inline_workers = self.config.get("inline_workers", 4)
+        self._inline_executor: Optional[ThreadPoolExecutor] = None
+        self._python_pool = (
+            _WorkerPool(("python", _PYTHON_WORKER), self.python_workers, self.worker_max_runs)
+            if self.python_workers > 0 else None
+        )
+        self._javascript_pool = (
+            _WorkerPool(("node", _NODE_WORKER), self.javascript_workers, self.worker_max_runs)
+            if self.javascript_workers > 0 else None
+        )
+        self._executors = {
+            "python": self._execute_python_inline if self.inline_python else self._execute_python,
+            "javascript": self._execute_javascript
+        }
     
     async def execute(
         self,
@@ -58,25 +449,21 @@ class CodeExecutorTool(BaseTool):
             return ToolResult(
                 status=ToolStatus.ERROR,
                 output=None,
-                error=f"Language '{language}' not allowed. Allowed: {self.allowed_languages}"
+                error=f"Language '{language}' not allowed. Allowed: {sorted(self.allowed_languages)}"
+            )
+        
+        executor = self._executors.get(language)
+        if executor is None:
+            return ToolResult(
+                status=ToolStatus.ERROR,
+                output=None,
+                error=f"Execution not implemented for {language}"
             )
         
         try:
-            logger.info(f"[CodeExecutor] Executing {language} code")
+            logger.info("[CodeExecutor] Executing %s code", language)
             
-            # Execute based on language
-            if language == "python":
-                result = await self._execute_python(code, stdin)
-            elif language == "javascript":
-                result = await self._execute_javascript(code, stdin)
-            else:
-                return ToolResult(
-                    status=ToolStatus.ERROR,
-                    output=None,
-                    error=f"Execution not implemented for {language}"
-                )
-            
-            return result
+            return await executor(code, stdin)
             
         except asyncio.TimeoutError:
             logger.error(f"[CodeExecutor] Timeout executing {language} code")
@@ -94,55 +481,155 @@ class CodeExecutorTool(BaseTool):
                 error=str(e)
             )
     
-    async def _execute_python(self, code: str, stdin: Optional[str]) -> ToolResult:
+    async def _drain(self, process: asyncio.subprocess.Process, reader: asyncio.StreamReader) -> Tuple[bytes, bool]:
         """
-        Execute Python code.
+        Read a snippet process stream up to max_output_bytes.
         
         Args:
-            code: Python code
+            process: Snippet process, killed once the cap is exceeded
+            reader: Its stdout or stderr stream
+            
+        Returns:
+            Tuple of (collected bytes, whether output was truncated)
+        """
+        cap = self.max_output_bytes
+        buf = bytearray()
+        while len(buf) <= cap:
+            chunk = await reader.read(65536)
+            if not chunk:
+                return bytes(buf), False
+            buf.extend(chunk)
+        if process.returncode is None:
+            process.kill()
+        return bytes(buf[:cap]), True
+    
+    async def _feed(self, process: asyncio.subprocess.Process, stdin: Optional[str]) -> None:
+        """Write stdin to a snippet process and close it."""
+        if process.stdin is None:
+            return
+        try:
+            if stdin:
+                process.stdin.write(stdin.encode())
+                await process.stdin.drain()
+            process.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            # The snippet exited without reading all of its input
+            pass
+    
+    async def _communicate(
+        self,
+        process: asyncio.subprocess.Process,
+        stdin: Optional[str]
+    ) -> Tuple[bytes, bytes, bool]:
+        """
+        Collect a snippet process's output with bounded buffers.
+        
+        Output beyond max_output_bytes per stream is dropped and the process
+        is killed; the process is also killed on timeout.
+        
+        Args:
+            process: Snippet process
             stdin: Standard input
             
         Returns:
-            ToolResult with output
+            Tuple of (stdout, stderr, whether output was truncated)
+            
+        Raises:
+            asyncio.TimeoutError: If the process exceeds the timeout
         """
         try:
-            # Create subprocess to execute code
-            process = await asyncio.create_subprocess_exec(
-                "python", "-c", code,
-                stdin=asyncio.subprocess.PIPE if stdin else None,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+            _, (stdout, out_truncated), (stderr, err_truncated) = await _bounded(
+                asyncio.gather(
+                    self._feed(process, stdin),
+                    self._drain(process, process.stdout),
+                    self._drain(process, process.stderr)
+                ),
+                self.timeout
             )
+            await process.wait()
+            return stdout, stderr, out_truncated or err_truncated
+        except BaseException:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+    
+    def _build_result(
+        self,
+        language: str,
+        output: str,
+        error: str,
+        return_code: int,
+        truncated: bool
+    ) -> ToolResult:
+        """
+        Build the ToolResult for a finished snippet.
+        
+        Args:
+            language: Programming language
+            output: Captured stdout
+            error: Captured stderr
+            return_code: Process return code
+            truncated: Whether output was cut at max_output_bytes
             
-            # Wait for completion with timeout
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(input=stdin.encode() if stdin else None),
-                timeout=self.timeout
+        Returns:
+            ToolResult with output
+        """
+        metadata = {
+            "language": language,
+            "return_code": return_code
+        }
+        if truncated:
+            metadata["truncated"] = True
+        
+        if return_code == 0:
+            return ToolResult(
+                status=ToolStatus.SUCCESS,
+                output=output,
+                metadata=metadata
             )
+        else:
+            return ToolResult(
+                status=ToolStatus.FAILURE,
+                output=output,
+                error=error,
+                metadata=metadata
+            )
+    
+    async def _execute_python(self, code: str, stdin: Optional[str]) -> ToolResult:
+        """
+        Execute Python code.
+        
+        Args:
+            code: Python code
+            stdin: Standard input
             
-            output = stdout.decode()
-            error = stderr.decode()
-            
-            if process.returncode == 0:
-                return ToolResult(
-                    status=ToolStatus.SUCCESS,
-                    output=output,
-                    metadata={
-                        "language": "python",
-                        "return_code": process.returncode
-                    }
+        Returns:
+            ToolResult with output
+        """
+        try:
+            if self._python_pool is not None:
+                output, error, return_code, truncated = await self._python_pool.run(
+                    code, stdin, self.timeout, self.max_output_bytes
                 )
             else:
-                return ToolResult(
-                    status=ToolStatus.FAILURE,
-                    output=output,
-                    error=error,
-                    metadata={
-                        "language": "python",
-                        "return_code": process.returncode
-                    }
+                # Create subprocess to execute code
+                process = await asyncio.create_subprocess_exec(
+                    "python", "-c", code,
+                    stdin=asyncio.subprocess.PIPE if stdin else None,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
                 )
                 
+                # Wait for completion with timeout
+                stdout, stderr, truncated = await self._communicate(process, stdin)
+                
+                output = stdout.decode(errors="replace")
+                error = stderr.decode(errors="replace")
+                return_code = process.returncode
+            
+            return self._build_result("python", output, error, return_code, truncated)
+                
         except FileNotFoundError:
             return ToolResult(
                 status=ToolStatus.ERROR,
@@ -150,6 +637,34 @@ class CodeExecutorTool(BaseTool):
                 error="Python interpreter not found"
             )
     
+    async def _execute_python_inline(self, code: str, stdin: Optional[str]) -> ToolResult:
+        """
+        Execute Python code in-process, skipping interpreter startup.
+        
+        Snippets that import modules or touch dunder names are run by
+        _execute_python instead.
+        
+        Args:
+            code: Python code
+            stdin: Standard input
+            
+        Returns:
+            ToolResult with output
+        """
+        compiled = _compile_inline(code)
+        if compiled is None:
+            return await self._execute_python(code, stdin)
+        
+        if self._inline_executor is None:
+            self._inline_executor = ThreadPoolExecutor(
+                max_workers=self.inline_workers,
+                thread_name_prefix="inline-python"
+            )
+        output, error, return_code, truncated = await asyncio.get_running_loop().run_in_executor(
+            self._inline_executor, _run_inline, compiled, stdin, self.timeout, self.max_output_bytes
+        )
+        return self._build_result("python", output, error, return_code, truncated)
+    
     async def _execute_javascript(self, code: str, stdin: Optional[str]) -> ToolResult:
         """
         Execute JavaScript code.
@@ -162,43 +677,29 @@ class CodeExecutorTool(BaseTool):
             ToolResult with output
         """
         try:
-            # Create subprocess to execute code with Node.js
-            process = await asyncio.create_subprocess_exec(
-                "node", "-e", code,
-                stdin=asyncio.subprocess.PIPE if stdin else None,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            # Wait for completion with timeout
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(input=stdin.encode() if stdin else None),
-                timeout=self.timeout
-            )
-            
-            output = stdout.decode()
-            error = stderr.decode()
-            
-            if process.returncode == 0:
-                return ToolResult(
-                    status=ToolStatus.SUCCESS,
-                    output=output,
-                    metadata={
-                        "language": "javascript",
-                        "return_code": process.returncode
-                    }
+            # Snippets reading stdin need a real process stdin
+            if self._javascript_pool is not None and not stdin:
+                output, error, return_code, truncated = await self._javascript_pool.run(
+                    code, None, self.timeout, self.max_output_bytes
                 )
             else:
-                return ToolResult(
-                    status=ToolStatus.FAILURE,
-                    output=output,
-                    error=error,
-                    metadata={
-                        "language": "javascript",
-                        "return_code": process.returncode
-                    }
+                # Create subprocess to execute code with Node.js
+                process = await asyncio.create_subprocess_exec(
+                    "node", "-e", code,
+                    stdin=asyncio.subprocess.PIPE if stdin else None,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
                 )
                 
+                # Wait for completion with timeout
+                stdout, stderr, truncated = await self._communicate(process, stdin)
+                
+                output = stdout.decode(errors="replace")
+                error = stderr.decode(errors="replace")
+                return_code = process.returncode
+            
+            return self._build_result("javascript", output, error, return_code, truncated)
+                
         except FileNotFoundError:
             return ToolResult(
                 status=ToolStatus.ERROR,
@@ -206,8 +707,17 @@ class CodeExecutorTool(BaseTool):
                 error="Node.js not found"
             )
     
-    def get_schema(self) -> Dict[str, Any]:
-        """Get tool schema for LLM function calling."""
+    async def aclose(self) -> None:
+        """Stop pooled worker processes and the inline thread pool."""
+        for pool in (self._python_pool, self._javascript_pool):
+            if pool is not None:
+                await pool.close()
+        if self._inline_executor is not None:
+            self._inline_executor.shutdown(wait=False)
+            self._inline_executor = None
+    
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build tool schema for LLM function calling."""
         return {
             "name": self.name,
             "description": self.description,
@@ -220,7 +730,7 @@ class CodeExecutorTool(BaseTool):
                     },
                     "language": {
                         "type": "string",
-                        "enum": self.allowed_languages,
+                        "enum": sorted(self.allowed_languages),
                         "description": "Programming language",
                         "default": "python"
                     },
@@ -5,12 +5,43 @@ Uses configuration from tool config - no hard-coded endpoints.
 """
 
 import logging
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 import httpx
+import orjson
 from .base import BaseTool, ToolResult, ToolStatus
 
 logger = logging.getLogger(__name__)
 
+# Default cap on response bodies read by tools
+DEFAULT_MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+
+
+async def read_response_body(response: httpx.Response, max_bytes: int) -> bytearray:
+    """
+    Read a streamed response body, refusing bodies larger than max_bytes.
+    
+    Args:
+        response: Response opened with client.stream()
+        max_bytes: Maximum body size in bytes
+        
+    Returns:
+        Response body
+        
+    Raises:
+        ValueError: If the body exceeds max_bytes
+    """
+    declared = response.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise ValueError(f"Response body exceeds {max_bytes} bytes")
+    
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) > max_bytes:
+            raise ValueError(f"Response body exceeds {max_bytes} bytes")
+    return body
+
 
 class HttpTool(BaseTool):
     """
@@ -19,6 +50,10 @@ class HttpTool(BaseTool):
     Supports GET, POST, PUT, DELETE methods with authentication.
     """
     
+    # Supported methods, and those that send a JSON body
+    _METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+    _BODY_METHODS = frozenset({"POST", "PUT"})
+    
     def __init__(self, name: str = "http_request", config: Optional[Dict[str, Any]] = None):
         """
         Initialize HTTP tool.
@@ -37,6 +72,31 @@ class HttpTool(BaseTool):
         self.auth_token = self.config.get("auth_token")
         self.timeout = self.config.get("timeout", 30)
         self.headers = self.config.get("headers", {})
+        self.max_response_bytes = self.config.get("max_response_bytes", DEFAULT_MAX_RESPONSE_BYTES)
+        # Static headers (config + auth) built once; shared read-only when a
+        # call brings no overrides
+        base_headers = dict(self.headers)
+        if self.auth_token:
+            base_headers["Authorization"] = f"Bearer {self.auth_token}"
+        self._base_headers = MappingProxyType(base_headers)
+        # Normalized once so relative URLs are joined by plain concatenation
+        self._base_prefix = self.base_url.rstrip("/") + "/" if self.base_url else None
+        # Created on first use and kept so connections are pooled across calls
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+        
+        Returns:
+            Long-lived AsyncClient with keep-alive connection pooling
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=100, max_connections=200)
+            )
+        return self._client
     
     async def execute(
         self,
@@ -61,54 +121,58 @@ class HttpTool(BaseTool):
         """
         try:
             # Build full URL
-            if self.base_url and not url.startswith("http"):
-                full_url = f"{self.base_url.rstrip('/')}/{url.lstrip('/')}"
+            if self._base_prefix and url[:4] != "http":
+                full_url = self._base_prefix + (url.lstrip("/") if url[:1] == "/" else url)
             else:
                 full_url = url
             
             # Build headers
-            request_headers = {**self.headers}
-            if self.auth_token:
-                request_headers["Authorization"] = f"Bearer {self.auth_token}"
-            if headers:
-                request_headers.update(headers)
+            request_headers = {**self._base_headers, **headers} if headers else self._base_headers
             
-            logger.info(f"[HttpTool] {method} {full_url}")
+            logger.info("[HttpTool] %s %s", method, full_url)
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                if method.upper() == "GET":
-                    response = await client.get(full_url, params=params, headers=request_headers)
-                elif method.upper() == "POST":
-                    response = await client.post(full_url, json=data, headers=request_headers)
-                elif method.upper() == "PUT":
-                    response = await client.put(full_url, json=data, headers=request_headers)
-                elif method.upper() == "DELETE":
-                    response = await client.delete(full_url, headers=request_headers)
-                else:
-                    return ToolResult(
-                        status=ToolStatus.ERROR,
-                        output=None,
-                        error=f"Unsupported HTTP method: {method}"
-                    )
-                
-                response.raise_for_status()
-                
-                # Try to parse JSON, fallback to text
-                try:
-                    result_data = response.json()
-                except Exception:
-                    result_data = response.text
-                
+            http_method = method.upper()
+            if http_method not in self._METHODS:
                 return ToolResult(
-                    status=ToolStatus.SUCCESS,
-                    output=result_data,
-                    metadata={
-                        "status_code": response.status_code,
-                        "url": full_url,
-                        "method": method
-                    }
+                    status=ToolStatus.ERROR,
+                    output=None,
+                    error=f"Unsupported HTTP method: {method}"
                 )
-                
+            
+            # Encode the JSON body with orjson instead of httpx's stdlib encoder
+            body = None
+            if data is not None and http_method in self._BODY_METHODS:
+                body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+                if not any(key.lower() == "content-type" for key in request_headers):
+                    request_headers = {**request_headers, "Content-Type": "application/json"}
+            
+            # Stream the body so oversized responses are rejected, not buffered
+            async with self._get_client().stream(
+                http_method,
+                full_url,
+                params=params,
+                content=body,
+                headers=request_headers
+            ) as response:
+                response.raise_for_status()
+                raw = await read_response_body(response, self.max_response_bytes)
+            
+            # Try to parse JSON, fallback to text
+            try:
+                result_data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                result_data = raw.decode(response.encoding or "utf-8", errors="replace")
+            
+            return ToolResult(
+                status=ToolStatus.SUCCESS,
+                output=result_data,
+                metadata={
+                    "status_code": response.status_code,
+                    "url": full_url,
+                    "method": method
+                }
+            )
+            
         except httpx.TimeoutException:
             logger.error(f"[HttpTool] Timeout for {method} {url}")
             return ToolResult(
@@ -133,8 +197,14 @@ class HttpTool(BaseTool):
                 error=str(e)
             )
     
-    def get_schema(self) -> Dict[str, Any]:
-        """Get tool schema for LLM function calling."""
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build tool schema for LLM function calling."""
         return {
             "name": self.name,
             "description": self.description,
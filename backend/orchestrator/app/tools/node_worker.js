@@ -0,0 +1,146 @@
+/**
+ * Node.js worker driver for CodeExecutorTool.
+ *
+ * Run by the worker pool; executes snippets sent over stdin so V8 is started
+ * once per worker instead of once per snippet. Uses the same framing as
+ * python_worker.py: 4-byte big-endian length followed by a UTF-8 JSON object.
+ * Requests are {"code": string, "max_output": number}; responses are
+ * {"stdout": string, "stderr": string, "rc": number, "truncated": boolean}.
+ * Output beyond max_output bytes per stream is dropped.
+ *
+ * Each snippet runs in a fresh vm context with console, process.stdout/stderr
+ * and process.exit redirected into the response. Work a snippet schedules
+ * for later (timers, pending I/O) is not waited for, unlike `node -e`.
+ */
+'use strict';
+
+const path = require('path');
+const util = require('util');
+const vm = require('vm');
+const { createRequire } = require('module');
+
+class ExitSignal extends Error {
+  constructor(code) {
+    super('process.exit');
+    this.exitCode = code;
+  }
+}
+
+class Capture {
+  constructor(cap) {
+    this.cap = cap;
+    this.chunks = [];
+    this.size = 0;
+    this.truncated = false;
+  }
+
+  push(text) {
+    if (this.size > this.cap) {
+      this.truncated = true;
+      return;
+    }
+    this.chunks.push(text);
+    this.size += Buffer.byteLength(text);
+  }
+
+  text() {
+    const buf = Buffer.from(this.chunks.join(''), 'utf8');
+    if (buf.length > this.cap) {
+      this.truncated = true;
+      return buf.subarray(0, this.cap).toString('utf8');
+    }
+    return buf.toString('utf8');
+  }
+}
+
+function makeSandbox(out, err) {
+  const line = (target) => (...args) => { target.push(util.format(...args) + '\n'); };
+  const stream = (target) => ({ write: (chunk) => { target.push(String(chunk)); return true; } });
+
+  const sandboxConsole = {
+    log: line(out),
+    info: line(out),
+    debug: line(out),
+    error: line(err),
+    warn: line(err),
+    trace: line(err),
+    dir: (obj) => out.push(util.inspect(obj) + '\n')
+  };
+  const sandboxProcess = Object.create(process, {
+    stdout: { value: stream(out) },
+    stderr: { value: stream(err) },
+    exit: { value: (code) => { throw new ExitSignal(code === undefined ? 0 : code); } }
+  });
+
+  return {
+    console: sandboxConsole,
+    process: sandboxProcess,
+    // Resolve modules from the working directory, like `node -e`
+    require: createRequire(path.join(process.cwd(), '[eval]')),
+    Buffer,
+    URL,
+    URLSearchParams,
+    TextEncoder,
+    TextDecoder,
+    setTimeout,
+    clearTimeout,
+    setInterval,
+    clearInterval,
+    setImmediate,
+    clearImmediate,
+    queueMicrotask
+  };
+}
+
+async function run(request) {
+  const out = new Capture(request.max_output);
+  const err = new Capture(request.max_output);
+  let rc = 0;
+  try {
+    const result = vm.runInNewContext(request.code, makeSandbox(out, err), { filename: '[eval]' });
+    if (result && typeof result.then === 'function') {
+      await result;
+    }
+  } catch (e) {
+    if (e instanceof ExitSignal) {
+      rc = e.exitCode;
+    } else {
+      err.push((e && e.stack ? e.stack : String(e)) + '\n');
+      rc = 1;
+    }
+  }
+  // Let already-queued callbacks run before answering
+  await new Promise((resolve) => setImmediate(resolve));
+  const stdout = out.text();
+  const stderr = err.text();
+  return { stdout, stderr, rc, truncated: out.truncated || err.truncated };
+}
+
+let buffer = Buffer.alloc(0);
+let queue = Promise.resolve();
+
+function respond(response) {
+  const body = Buffer.from(JSON.stringify(response), 'utf8');
+  const header = Buffer.alloc(4);
+  header.writeUInt32BE(body.length, 0);
+  process.stdout.write(Buffer.concat([header, body]));
+}
+
+process.stdin.on('data', (chunk) => {
+  buffer = Buffer.concat([buffer, chunk]);
+  while (buffer.length >= 4) {
+    const size = buffer.readUInt32BE(0);
+    if (buffer.length < 4 + size) {
+      break;
+    }
+    const request = JSON.parse(buffer.subarray(4, 4 + size).toString('utf8'));
+    buffer = buffer.subarray(4 + size);
+    queue = queue.then(() => run(request)).then(respond);
+  }
+});
+
+// Errors from work a snippet left running must not take the worker down
+process.on('uncaughtException', () => {});
+process.on('unhandledRejection', () => {});
+
+process.stdin.on('end', () => process.exit(0));
@@ -0,0 +1,139 @@
+"""
+Python worker driver for CodeExecutorTool.
+
+Run as a script by the worker pool; executes snippets sent over stdin so the
+interpreter is started once per worker instead of once per snippet.
+
+Protocol (both directions): 4-byte big-endian length followed by a UTF-8 JSON
+object. Requests are {"code": str, "stdin": str | null, "max_output": int};
+responses are {"stdout": str, "stderr": str, "rc": int, "truncated": bool}.
+Output beyond max_output bytes per stream stays on disk and is not returned.
+
+Only the standard library is used, since the worker runs under whichever
+`python` is on PATH.
+"""
+
+import builtins
+import io
+import json
+import os
+import struct
+import sys
+import tempfile
+import traceback
+
+_HEADER = struct.Struct(">I")
+# Private codec instances, so snippets that patch json.dumps/json.loads
+# do not break the protocol
+_ENCODER = json.JSONEncoder()
+_DECODER = json.JSONDecoder()
+
+
+def _read_exact(fd: int, size: int) -> bytes:
+    """Read exactly size bytes from fd; return b"" on EOF."""
+    chunks = []
+    while size:
+        chunk = os.read(fd, size)
+        if not chunk:
+            return b""
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _run(code: str, stdin: str, out_fd: int, err_fd: int) -> int:
+    """
+    Execute one snippet the way `python -c` would.
+
+    Args:
+        code: Python source
+        stdin: Text served on sys.stdin
+        out_fd: File descriptor receiving stdout
+        err_fd: File descriptor receiving stderr
+
+    Returns:
+        Process-style return code
+    """
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+    sys.stdin = io.StringIO(stdin)
+    sys.stdout = open(1, "w", encoding="utf-8", errors="replace", closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", errors="replace", closefd=False)
+
+    rc = 0
+    try:
+        exec(compile(code, "<string>", "exec"), {"__name__": "__main__", "__builtins__": builtins})
+    except SystemExit as e:
+        if e.code is None:
+            rc = 0
+        elif isinstance(e.code, int):
+            rc = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            rc = 1
+    except BaseException as e:
+        # Skip this function's frame so the traceback matches `python -c`
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        rc = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+    return rc
+
+
+def main() -> None:
+    """Serve snippet requests until stdin is closed."""
+    # Keep private copies of the protocol pipes; fds 0-2 belong to snippets
+    proto_in = os.dup(0)
+    proto_out = os.dup(1)
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    # Match `python -c`: imports resolve from the working directory
+    sys.path[0] = ""
+
+    # Capture files are created once and truncated per snippet, so a run
+    # costs no file creation or unlink
+    out = tempfile.TemporaryFile()
+    err = tempfile.TemporaryFile()
+
+    while True:
+        header = _read_exact(proto_in, _HEADER.size)
+        if not header:
+            break
+        request = _DECODER.decode(_read_exact(proto_in, _HEADER.unpack(header)[0]).decode("utf-8"))
+
+        for capture in (out, err):
+            capture.seek(0)
+            capture.truncate()
+        rc = _run(request["code"], request.get("stdin") or "", out.fileno(), err.fileno())
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        cap = request["max_output"]
+        out.seek(0)
+        err.seek(0)
+        stdout = out.read(cap + 1)
+        stderr = err.read(cap + 1)
+        response = _ENCODER.encode({
+            "stdout": stdout[:cap].decode("utf-8", "replace"),
+            "stderr": stderr[:cap].decode("utf-8", "replace"),
+            "rc": rc,
+            "truncated": len(stdout) > cap or len(stderr) > cap
+        }).encode("utf-8")
+
+        _write_all(proto_out, _HEADER.pack(len(response)) + response)
+
+
+if __name__ == "__main__":
+    main()
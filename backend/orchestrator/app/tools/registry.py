@@ -4,8 +4,10 @@ Tool Registry - Dynamic tool registration and management.
 Loads tools from configuration - no hard-coded tool instances.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Set
 from .base import BaseTool
 from .http_tool import HttpTool
 from .web_search_tool import WebSearchTool
@@ -13,6 +15,14 @@ from .code_executor_tool import CodeExecutorTool
 
 logger = logging.getLogger(__name__)
 
+# Map of tool types to classes (read-only)
+_TOOL_CLASSES = MappingProxyType({
+    "http": HttpTool,
+    "http_request": HttpTool,  # Alias for http
+    "web_search": WebSearchTool,
+    "code_executor": CodeExecutorTool,
+})
+
 
 class ToolRegistry:
     """
@@ -21,17 +31,34 @@ class ToolRegistry:
     Supports dynamic tool registration from configuration.
     """
     
+    __slots__ = ("_tools", "_closing", "_schemas_list")
+    
     # Map of tool types to classes
-    TOOL_CLASSES = {
-        "http": HttpTool,
-        "http_request": HttpTool,  # Alias for http
-        "web_search": WebSearchTool,
-        "code_executor": CodeExecutorTool,
-    }
+    TOOL_CLASSES = _TOOL_CLASSES
     
     def __init__(self):
         """Initialize tool registry."""
         self._tools: Dict[str, BaseTool] = {}
+        # Pending aclose() tasks for tools removed outside a coroutine
+        self._closing: Set[asyncio.Task] = set()
+        # Schemas of registered tools, rebuilt lazily after changes
+        self._schemas_list: Optional[List[Dict[str, Any]]] = None
+    
+    def _close_tool(self, tool: BaseTool) -> None:
+        """
+        Schedule release of a removed tool's resources.
+        
+        Args:
+            tool: Tool that is no longer registered
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to close on; pooled connections are dropped with the tool
+            return
+        task = loop.create_task(tool.aclose())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
     
     def register_tool(self, tool: BaseTool) -> None:
         """
@@ -40,7 +67,11 @@ class ToolRegistry:
         Args:
             tool: Tool instance to register
         """
+        previous = self._tools.get(tool.name)
         self._tools[tool.name] = tool
+        self._schemas_list = None
+        if previous is not None and previous is not tool:
+            self._close_tool(previous)
         logger.info(f"[ToolRegistry] Registered tool: {tool.name}")
     
     def register_from_config(self, config: Dict[str, Any]) -> None:
@@ -58,8 +89,9 @@ class ToolRegistry:
             logger.error("[ToolRegistry] Invalid tool config: missing type or name")
             return
         
-        tool_class = self.TOOL_CLASSES.get(tool_type)
-        if not tool_class:
+        try:
+            tool_class = _TOOL_CLASSES[tool_type]
+        except KeyError:
             logger.error(f"[ToolRegistry] Unknown tool type: {tool_type}")
             return
         
@@ -116,7 +148,9 @@ class ToolRegistry:
         Returns:
             List of tool schemas for LLM function calling
         """
-        return [tool.get_schema() for tool in self._tools.values()]
+        if self._schemas_list is None:
+            self._schemas_list = [tool.get_schema() for tool in self._tools.values()]
+        return self._schemas_list.copy()
     
     def unregister_tool(self, name: str) -> bool:
         """
@@ -129,16 +163,31 @@ class ToolRegistry:
             True if tool was unregistered, False if not found
         """
         if name in self._tools:
-            del self._tools[name]
+            self._close_tool(self._tools.pop(name))
+            self._schemas_list = None
             logger.info(f"[ToolRegistry] Unregistered tool: {name}")
             return True
         return False
     
     def clear(self) -> None:
         """Clear all registered tools."""
+        for tool in self._tools.values():
+            self._close_tool(tool)
         self._tools.clear()
+        self._schemas_list = None
         logger.info("[ToolRegistry] Cleared all tools")
     
+    async def close(self) -> None:
+        """Close all registered tools and remove them."""
+        tools = list(self._tools.values())
+        self._tools.clear()
+        self._schemas_list = None
+        await asyncio.gather(
+            *(tool.aclose() for tool in tools),
+            *self._closing,
+            return_exceptions=True
+        )
+    
     def __len__(self) -> int:
         """Get number of registered tools."""
         return len(self._tools)
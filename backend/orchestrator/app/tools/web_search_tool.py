@@ -5,9 +5,13 @@ Uses configuration from tool config - no hard-coded API keys.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Hashable, Optional, List, Tuple
 import httpx
+import orjson
 from .base import BaseTool, ToolResult, ToolStatus
+from .http_tool import DEFAULT_MAX_RESPONSE_BYTES, read_response_body
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +42,28 @@ class WebSearchTool(BaseTool):
         self.provider = self.config.get("provider", "generic")
         self.timeout = self.config.get("timeout", 30)
         self.max_results = self.config.get("max_results", 10)
+        self.max_response_bytes = self.config.get("max_response_bytes", DEFAULT_MAX_RESPONSE_BYTES)
+        self.cache_size = self.config.get("cache_size", 1024)
+        self.cache_ttl = self.config.get("cache_ttl", 300)
+        # Created on first use and kept so searches reuse the connection
+        self._client: Optional[httpx.AsyncClient] = None
+        # LRU of (expires_at, results, etag); expired entries are kept so
+        # their ETag can be revalidated instead of refetched
+        self._cache: OrderedDict[Hashable, Tuple[float, List[Dict[str, Any]], Optional[str]]] = OrderedDict()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared search client, creating it on first use.
+        
+        Returns:
+            Long-lived AsyncClient carrying the provider auth header
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers={"Authorization": f"Bearer {self.api_key}"}
+            )
+        return self._client
     
     async def execute(
         self,
@@ -73,10 +99,21 @@ class WebSearchTool(BaseTool):
         max_results = max_results or self.max_results
         
         try:
-            logger.info(f"[WebSearch] Searching for: {query}")
+            # Filter values may be lists, so key on their canonical JSON
+            cache_key = (
+                query,
+                orjson.dumps(filters, option=orjson.OPT_SORT_KEYS) if filters else None,
+                max_results
+            )
+            cached = self._cache.get(cache_key) if self.cache_size else None
+            if cached is not None and cached[0] > time.monotonic():
+                self._cache.move_to_end(cache_key)
+                logger.debug("[WebSearch] Cache hit for: %s", query)
+                return self._cached_result(query, cached[1], "hit")
+            
+            logger.info("[WebSearch] Searching for: %s", query)
             
             # Build request based on provider
-            headers = {"Authorization": f"Bearer {self.api_key}"}
             params = {
                 "q": query,
                 "limit": max_results
@@ -85,27 +122,35 @@ class WebSearchTool(BaseTool):
             if filters:
                 params.update(filters)
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    self.endpoint,
-                    params=params,
-                    headers=headers
-                )
+            headers = None
+            if cached is not None and cached[2]:
+                headers = {"If-None-Match": cached[2]}
+            
+            # Stream the body so oversized responses are rejected, not buffered
+            async with self._get_client().stream("GET", self.endpoint, params=params, headers=headers) as response:
+                if response.status_code == 304 and cached is not None:
+                    self._store(cache_key, cached[1], cached[2])
+                    logger.debug("[WebSearch] Revalidated cached results for: %s", query)
+                    return self._cached_result(query, cached[1], "revalidated")
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(await read_response_body(response, self.max_response_bytes))
+                etag = response.headers.get("etag")
             
             # Parse results based on provider
             results = self._parse_results(data)
+            if self.cache_size:
+                self._store(cache_key, results, etag)
             
-            logger.info(f"[WebSearch] Found {len(results)} results")
+            logger.info("[WebSearch] Found %d results", len(results))
             
             return ToolResult(
                 status=ToolStatus.SUCCESS,
-                output=results,
+                output=[dict(item) for item in results],
                 metadata={
                     "query": query,
                     "result_count": len(results),
-                    "provider": self.provider
+                    "provider": self.provider,
+                    "cache": "miss"
                 }
             )
             
@@ -133,6 +178,50 @@ class WebSearchTool(BaseTool):
                 error=str(e)
             )
     
+    def _store(self, key: Hashable, results: List[Dict[str, Any]], etag: Optional[str]) -> None:
+        """
+        Cache results for cache_ttl seconds, evicting least recently used entries.
+        
+        Args:
+            key: Cache key built from query, filters and max_results
+            results: Parsed search results
+            etag: Provider ETag for later revalidation, if any
+        """
+        self._cache[key] = (time.monotonic() + self.cache_ttl, results, etag)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def _cached_result(self, query: str, results: List[Dict[str, Any]], cache: str) -> ToolResult:
+        """
+        Build a ToolResult from cached results.
+        
+        Args:
+            query: Search query
+            results: Cached search results
+            cache: Cache outcome reported in metadata ("hit" or "revalidated")
+            
+        Returns:
+            ToolResult holding copies of the cached results
+        """
+        # Copy the result dicts so callers cannot mutate the cache
+        return ToolResult(
+            status=ToolStatus.SUCCESS,
+            output=[dict(item) for item in results],
+            metadata={
+                "query": query,
+                "result_count": len(results),
+                "provider": self.provider,
+                "cache": cache
+            }
+        )
+    
+    async def aclose(self) -> None:
+        """Close the shared search client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _parse_results(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Parse search results based on provider format.
@@ -144,24 +233,23 @@ class WebSearchTool(BaseTool):
             Normalized list of results
         """
         # Generic parser - override for specific providers
-        results = []
-        
         # Try common result formats
-        items = data.get("results") or data.get("items") or data.get("data") or []
+        items = data.get("results") or data.get("items") or data.get("data") or ()
         
-        for item in items:
-            result = {
-                "title": item.get("title") or item.get("name") or "",
-                "url": item.get("url") or item.get("link") or "",
-                "snippet": item.get("snippet") or item.get("description") or "",
-                "source": item.get("source") or item.get("domain") or ""
+        # Bind dict.get once instead of resolving item.get per field
+        get = dict.get
+        return [
+            {
+                "title": get(item, "title") or get(item, "name") or "",
+                "url": get(item, "url") or get(item, "link") or "",
+                "snippet": get(item, "snippet") or get(item, "description") or "",
+                "source": get(item, "source") or get(item, "domain") or ""
             }
-            results.append(result)
-        
-        return results
+            for item in items
+        ]
     
-    def get_schema(self) -> Dict[str, Any]:
-        """Get tool schema for LLM function calling."""
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build tool schema for LLM function calling."""
         return {
             "name": self.name,
             "description": self.description,
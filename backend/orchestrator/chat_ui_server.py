@@ -24,14 +24,18 @@ app = FastAPI(
 # Get settings
 settings = get_settings()
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for testing
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware, only when cross-origin access is configured; explicit
+# origins avoid wildcard matching, and max_age lets browsers cache preflights
+cors_origins = settings.get_cors_origins_list()
+if cors_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        max_age=86400,
+    )
 
 # Include router
 app.include_router(chat_ui_router)
@@ -64,10 +68,12 @@ if __name__ == "__main__":
     logger.info("CHAT STUDIO API SERVER")
     logger.info("=" * 80)
     
-    # Print all available routes
-    logger.info("Available routes:")
-    for route in app.routes:
-        logger.info(f"  {route.path} [{','.join(getattr(route, 'methods', []))}]")
+    # Print all available routes in a single log record
+    routes = "\n".join(
+        f"  {route.path} [{','.join(getattr(route, 'methods', None) or ())}]"
+        for route in app.routes
+    )
+    logger.info("Available routes:\n%s", routes)
     
     logger.info("=" * 80)
     logger.info("Starting server...")
@@ -78,5 +84,5 @@ if __name__ == "__main__":
         "chat_ui_server:app",
         host="0.0.0.0",
         port=8001,  # Use a different port to avoid conflicts
-        reload=True
+        reload=settings.debug
     )
@@ -12,7 +12,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
 from app.db.database import init_db, SessionLocal
-from app.db.models import Base, Conversation, Message, PromptProfile, ChatMetric, Credential
+from app.db.models import Conversation, Message, PromptProfile, ChatMetric, Credential
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -50,10 +50,8 @@ async def seed_default_data():
                     }
                 ]
                 
-                for profile_data in default_profiles:
-                    profile = PromptProfile(**profile_data)
-                    db.add(profile)
-                
+                # One batched INSERT, skipping per-object unit-of-work bookkeeping
+                db.bulk_insert_mappings(PromptProfile, default_profiles)
                 db.commit()
                 logger.info(f"✓ Seeded {len(default_profiles)} default prompt profiles")
             else:
@@ -68,14 +66,10 @@ async def seed_default_data():
 def create_tables_directly():
     """Create tables directly using SQLAlchemy."""
     try:
-        from sqlalchemy import create_engine
-        from app.db.database import DATABASE_URL
-        
-        # Create engine
-        engine = create_engine(DATABASE_URL)
+        from app.db.database import create_missing_tables, engine
         
-        # Create tables
-        Base.metadata.create_all(bind=engine)
+        # Create tables on the shared pooled engine SessionLocal is bound to
+        create_missing_tables(engine)
         
         logger.info("✓ Tables created directly")
         return True
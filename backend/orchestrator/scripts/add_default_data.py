@@ -6,7 +6,9 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from app.db.database import SessionLocal
+from sqlalchemy import select
+
+from app.db.database import engine
 from app.db.models import PromptProfile
 from app.config import get_settings
 
@@ -15,47 +17,45 @@ logger = logging.getLogger(__name__)
 
 def add_default_prompt_profiles():
     """Add default prompt profiles if they don't exist."""
-    db = SessionLocal()
     try:
         # Check if any profiles exist
-        existing = db.query(PromptProfile).first()
+        with engine.connect() as conn:
+            existing = conn.execute(select(PromptProfile.id).limit(1)).first()
         if existing:
             logger.info("✓ Prompt profiles already exist")
             return True
         
         # Add default profiles
         default_profiles = [
-            PromptProfile(
-                name="Default",
-                description="Standard conversational prompt",
-                system_prompt="You are a helpful AI assistant. Answer questions accurately and be concise.",
-                is_active=True
-            ),
-            PromptProfile(
-                name="Technical",
-                description="Technical assistant for programming and IT",
-                system_prompt="You are a technical assistant specializing in programming, software development, and IT. Provide detailed technical explanations and code examples when appropriate.",
-                is_active=True
-            ),
-            PromptProfile(
-                name="Creative",
-                description="Creative assistant for writing and brainstorming",
-                system_prompt="You are a creative assistant specializing in writing, brainstorming, and creative tasks. Be imaginative and help with creative projects.",
-                is_active=True
-            )
+            {
+                "name": "Default",
+                "description": "Standard conversational prompt",
+                "system_prompt": "You are a helpful AI assistant. Answer questions accurately and be concise.",
+                "is_active": True
+            },
+            {
+                "name": "Technical",
+                "description": "Technical assistant for programming and IT",
+                "system_prompt": "You are a technical assistant specializing in programming, software development, and IT. Provide detailed technical explanations and code examples when appropriate.",
+                "is_active": True
+            },
+            {
+                "name": "Creative",
+                "description": "Creative assistant for writing and brainstorming",
+                "system_prompt": "You are a creative assistant specializing in writing, brainstorming, and creative tasks. Be imaginative and help with creative projects.",
+                "is_active": True
+            }
         ]
         
-        for profile in default_profiles:
-            db.add(profile)
-        
-        db.commit()
+        # Core executemany skips the ORM and lets the dialect batch the rows
+        # into multi-row INSERTs, all in one transaction
+        with engine.begin() as conn:
+            conn.execute(PromptProfile.__table__.insert(), default_profiles)
         logger.info(f"✓ Added {len(default_profiles)} default prompt profiles")
         return True
     except Exception as e:
         logger.error(f"✗ Error adding default prompt profiles: {str(e)}")
         return False
-    finally:
-        db.close()
 
 def main():
     """Add default data for Chat Studio."""
@@ -6,7 +6,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from app.db.database import init_db
-from app.db.models import Base, Conversation, Message, PromptProfile, ChatMetric, Credential
+from app.db.models import Conversation, Message, PromptProfile, ChatMetric, Credential
 from app.config import get_settings
 
 logging.basicConfig(level=logging.INFO)
@@ -32,14 +32,10 @@ def main():
         logger.info("Trying to create tables directly...")
         
         try:
-            from sqlalchemy import create_engine
-            from app.db.database import DATABASE_URL
+            from app.db.database import create_missing_tables, engine
             
-            # Create engine
-            engine = create_engine(DATABASE_URL)
-            
-            # Create tables
-            Base.metadata.create_all(bind=engine)
+            # Create tables on the shared pooled engine init_db() used
+            create_missing_tables(engine)
             
             logger.info("✓ Tables created directly")
         except Exception as e:
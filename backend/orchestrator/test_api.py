@@ -5,19 +5,24 @@ Test script for API endpoints.
 import requests
 import json
 import logging
+from requests.adapters import HTTPAdapter
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 BASE_URL = "http://localhost:8000"
 
+# One keep-alive session so every endpoint check reuses the same connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+
 def test_endpoint(endpoint, expected_status=200):
     """Test an API endpoint."""
     url = f"{BASE_URL}{endpoint}"
     logger.info(f"Testing endpoint: {url}")
     
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=5)
         status = response.status_code
         
         if status == expected_status:
@@ -35,14 +35,25 @@ async def test_models():
         logger.error(f"Error testing models: {str(e)}")
         return False
 
+async def run_with_timeout(test, timeout=10):
+    """Run a test coroutine, failing it if it takes longer than timeout seconds."""
+    try:
+        return await asyncio.wait_for(test(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"{test.__name__} timed out after {timeout}s")
+        return False
+
 async def main():
     """Run all tests."""
     logger.info("=" * 80)
     logger.info("CHAT UI API TEST")
     logger.info("=" * 80)
     
-    profiles_success = await test_profiles()
-    models_success = await test_models()
+    # The endpoints are independent, so run both checks concurrently
+    profiles_success, models_success = await asyncio.gather(
+        run_with_timeout(test_profiles),
+        run_with_timeout(test_models)
+    )
     
     logger.info("=" * 80)
     logger.info(f"Profiles test: {'✓ Success' if profiles_success else '✗ Failed'}")
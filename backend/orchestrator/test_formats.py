@@ -0,0 +1,211 @@
+"""
+Test script for binary storage and wire formats.
+
+Round-trips the state store payloads and keys, the credential token format
+(with legacy Fernet tokens), and the Python worker protocol, without
+needing Redis, a database, or a running server.
+"""
+
+import os
+import base64
+import json
+import uuid
+import asyncio
+import logging
+import subprocess
+from datetime import datetime, timezone
+
+from cryptography.fernet import Fernet
+
+from app.memory.state_store import _dumps, _loads, _key, _load_path, _FORMAT_MSGPACK, _UUID_KEY_PREFIX, _TEXT_KEY_PREFIX
+from app.security import credentials
+from app.tools.code_executor_tool import _HEADER, _PYTHON_WORKER, _WorkerPool
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SAMPLE_STATE = {
+    "execution_id": "exec-1",
+    "status": "running",
+    "step": 3,
+    "messages": [{"role": "user", "content": "héllo"}],
+    "metadata": {"score": 0.5, "tags": ["a", "b"], "empty": None},
+}
+
+
+def test_state_payloads():
+    """Test state store payload encoding, including legacy JSON payloads."""
+    logger.info("Testing state store payloads...")
+    try:
+        encoded = _dumps(SAMPLE_STATE)
+        assert encoded[:1] == _FORMAT_MSGPACK, "payload is not version-prefixed"
+        assert _loads(encoded) == SAMPLE_STATE, "MessagePack round-trip changed the state"
+
+        # Payloads written before the MessagePack format are plain JSON
+        legacy = json.dumps(SAMPLE_STATE).encode("utf-8")
+        assert _loads(legacy) == SAMPLE_STATE, "legacy JSON payload did not decode"
+
+        # Partial reads agree with full decodes for both formats
+        for data in (encoded, legacy):
+            assert _load_path(data, ["metadata", "tags"]) == ["a", "b"]
+            assert _load_path(data, ["status"]) == "running"
+            assert _load_path(data, ["metadata", "missing"]) is None
+            assert _load_path(data, ["step", "nested"]) is None
+
+        # Datetimes come back as timezone-aware datetimes
+        stamped = {"created_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)}
+        assert _loads(_dumps(stamped)) == stamped, "datetime did not round-trip"
+
+        logger.info("✓ State payloads round-trip")
+        return True
+    except Exception as e:
+        logger.error(f"✗ State payload test failed: {e!r}")
+        return False
+
+
+def test_state_keys():
+    """Test compact UUID keys and text keys for execution IDs."""
+    logger.info("Testing state store keys...")
+    try:
+        execution_id = str(uuid.uuid4())
+        key = _key(execution_id)
+        assert key.startswith(_UUID_KEY_PREFIX), "UUID ID did not get a compact key"
+        assert len(key) == len(_UUID_KEY_PREFIX) + 16, "compact key is not prefix + 16 bytes"
+        assert str(uuid.UUID(bytes=key[len(_UUID_KEY_PREFIX):])) == execution_id
+
+        # Non-canonical spellings keep text keys so they still map back exactly
+        for text_id in ("user_123_run", execution_id.upper(), execution_id.replace("-", "")):
+            assert _key(text_id) == _TEXT_KEY_PREFIX + text_id.encode("utf-8"), f"unexpected key for {text_id}"
+
+        logger.info("✓ State keys map back to their IDs")
+        return True
+    except Exception as e:
+        logger.error(f"✗ State key test failed: {e!r}")
+        return False
+
+
+def test_credential_tokens():
+    """Test AES-GCM credential tokens and legacy Fernet token decoding."""
+    logger.info("Testing credential tokens...")
+    previous_key = os.environ.get("ORCH_CRED_KEY")
+    os.environ["ORCH_CRED_KEY"] = Fernet.generate_key().decode()
+    credentials.reset_key_cache()
+    try:
+        secret = "s3cret-välue"
+        token = credentials.encrypt_secret(secret)
+        raw = base64.urlsafe_b64decode(token)
+        assert raw[:1] == credentials._GCM_VERSION, "token is not version-prefixed"
+        assert credentials.decrypt_secret(token) == secret, "AES-GCM round-trip failed"
+        assert credentials.encrypt_secret(secret) != token, "nonce was reused"
+
+        # Tokens written before the AES-GCM format are Fernet tokens
+        legacy = Fernet(credentials.get_crypto_key()).encrypt(secret.encode("utf-8")).decode()
+        assert credentials.decrypt_secret(legacy) == secret, "legacy Fernet token did not decode"
+
+        # A tampered token must be rejected, not decrypted
+        tampered = base64.urlsafe_b64encode(raw[:-1] + bytes([raw[-1] ^ 1])).decode()
+        try:
+            credentials.decrypt_secret(tampered)
+        except credentials.CredentialEncryptionError:
+            pass
+        else:
+            raise AssertionError("tampered token decrypted")
+
+        logger.info("✓ Credential tokens round-trip")
+        return True
+    except Exception as e:
+        logger.error(f"✗ Credential token test failed: {e!r}")
+        return False
+    finally:
+        if previous_key is None:
+            os.environ.pop("ORCH_CRED_KEY", None)
+        else:
+            os.environ["ORCH_CRED_KEY"] = previous_key
+        credentials.reset_key_cache()
+
+
+def _frame(message):
+    """Encode one worker protocol message."""
+    payload = json.dumps(message).encode("utf-8")
+    return _HEADER.pack(len(payload)) + payload
+
+
+def test_worker_protocol():
+    """Test the length-prefixed protocol against the worker script directly."""
+    logger.info("Testing worker protocol...")
+    requests = [
+        {"code": "print(input()[::-1])", "stdin": "abc\n", "max_output": 1024},
+        {"code": "import sys; sys.stderr.write('oops'); raise SystemExit(3)", "stdin": None, "max_output": 1024},
+        {"code": "print('x' * 100)", "stdin": None, "max_output": 10},
+    ]
+    try:
+        result = subprocess.run(
+            ["python", _PYTHON_WORKER],
+            input=b"".join(_frame(request) for request in requests),
+            capture_output=True,
+            timeout=30
+        )
+        data = result.stdout
+        responses = []
+        while data:
+            size = _HEADER.unpack(data[:_HEADER.size])[0]
+            responses.append(json.loads(data[_HEADER.size:_HEADER.size + size]))
+            data = data[_HEADER.size + size:]
+
+        assert result.returncode == 0, f"worker exited with {result.returncode}"
+        assert len(responses) == len(requests), f"expected {len(requests)} responses, got {len(responses)}"
+        assert responses[0] == {"stdout": "cba\n", "stderr": "", "rc": 0, "truncated": False}
+        assert responses[1]["rc"] == 3 and responses[1]["stderr"] == "oops"
+        assert responses[2]["truncated"] and len(responses[2]["stdout"]) <= 10
+
+        logger.info("✓ Worker protocol frames round-trip")
+        return True
+    except Exception as e:
+        logger.error(f"✗ Worker protocol test failed: {e!r}")
+        return False
+
+
+async def test_worker_pool():
+    """Test the worker pool, including a snippet that kills its worker."""
+    logger.info("Testing worker pool...")
+    pool = _WorkerPool(("python", _PYTHON_WORKER), size=1, max_runs=10)
+    try:
+        assert await pool.run("print(1 + 1)", None, 10, 1024) == ("2\n", "", 0, False)
+        assert await pool.run("import os; os._exit(7)", None, 10, 1024) == ("", "", 7, False)
+        # The slot is refilled after the worker died
+        assert await pool.run("print('again')", None, 10, 1024) == ("again\n", "", 0, False)
+
+        logger.info("✓ Worker pool runs snippets")
+        return True
+    except Exception as e:
+        logger.error(f"✗ Worker pool test failed: {e!r}")
+        return False
+    finally:
+        await pool.close()
+
+
+def main():
+    """Run all tests."""
+    logger.info("=" * 80)
+    logger.info("FORMAT TEST")
+    logger.info("=" * 80)
+
+    results = {
+        "State payloads": test_state_payloads(),
+        "State keys": test_state_keys(),
+        "Credential tokens": test_credential_tokens(),
+        "Worker protocol": test_worker_protocol(),
+        "Worker pool": asyncio.run(test_worker_pool()),
+    }
+
+    logger.info("=" * 80)
+    for name, success in results.items():
+        logger.info(f"{name} test: {'✓ Success' if success else '✗ Failed'}")
+    logger.info("=" * 80)
+
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
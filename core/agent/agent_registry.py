@@ -6,7 +6,9 @@ Defines agents by name for external integrations.
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Union
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, Union
 
 from langchain.agents import AgentExecutor, create_openai_functions_agent
 from langchain.agents.format_scratchpad import format_to_openai_functions
@@ -22,6 +24,37 @@ from ..tools.tool_registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+# Prompt pieces shared by every agent
+_CHAT_HISTORY_PLACEHOLDER = MessagesPlaceholder(variable_name="chat_history")
+_AGENT_SCRATCHPAD_PLACEHOLDER = MessagesPlaceholder(variable_name="agent_scratchpad")
+
+# Prompt templates are immutable, so agents with the same system prompt share one
+_PROMPT_CACHE: Dict[str, ChatPromptTemplate] = {}
+
+
+def _get_prompt(system_prompt: str) -> ChatPromptTemplate:
+    """
+    Get the agent prompt template for a system prompt, building it on first use.
+    
+    Args:
+        system_prompt: Agent system prompt
+        
+    Returns:
+        Chat prompt template
+    """
+    prompt = _PROMPT_CACHE.get(system_prompt)
+    if prompt is None:
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                SystemMessage(content=system_prompt),
+                _CHAT_HISTORY_PLACEHOLDER,
+                ("user", "{input}"),
+                _AGENT_SCRATCHPAD_PLACEHOLDER,
+            ]
+        )
+        _PROMPT_CACHE[system_prompt] = prompt
+    return prompt
+
 
 class AgentRegistry:
     """
@@ -34,7 +67,9 @@ class AgentRegistry:
         self, 
         config_service: ConfigService,
         llm_registry: LLMRegistry,
-        tool_registry: ToolRegistry
+        tool_registry: ToolRegistry,
+        max_agents: int = 64,
+        agent_ttl: float = 3600
     ):
         """
         Initialize agent registry.
@@ -43,11 +78,17 @@ class AgentRegistry:
             config_service: Configuration service
             llm_registry: LLM registry
             tool_registry: Tool registry
+            max_agents: Maximum number of cached agent instances
+            agent_ttl: Seconds an unused agent instance stays cached
         """
         self.config_service = config_service
         self.llm_registry = llm_registry
         self.tool_registry = tool_registry
-        self._agent_instances: Dict[str, AgentExecutor] = {}
+        self.max_agents = max_agents
+        self.agent_ttl = agent_ttl
+        # LRU of (expires_at, agent); idle agents are dropped so their LLM
+        # clients and memory buffers can be freed
+        self._agent_instances: OrderedDict[str, Tuple[float, AgentExecutor]] = OrderedDict()
     
     def get_agent(self, name: str) -> Optional[AgentExecutor]:
         """
@@ -59,9 +100,15 @@ class AgentRegistry:
         Returns:
             LangChain agent instance or None if not found/configured
         """
-        # Return cached instance if available
-        if name in self._agent_instances:
-            return self._agent_instances[name]
+        # Return cached instance if available and not idle for too long
+        now = time.monotonic()
+        entry = self._agent_instances.get(name)
+        if entry is not None:
+            if entry[0] > now:
+                self._agent_instances[name] = (now + self.agent_ttl, entry[1])
+                self._agent_instances.move_to_end(name)
+                return entry[1]
+            del self._agent_instances[name]
         
         # Get configuration
         config = self.config_service.get_agent_config(name)
@@ -77,7 +124,9 @@ class AgentRegistry:
         try:
             agent = self._create_agent_instance(config)
             if agent:
-                self._agent_instances[name] = agent
+                self._agent_instances[name] = (now + self.agent_ttl, agent)
+                while len(self._agent_instances) > self.max_agents:
+                    self._agent_instances.popitem(last=False)
                 return agent
             else:
                 logger.error(f"Failed to create agent instance: {name}")
@@ -103,32 +152,20 @@ class AgentRegistry:
                 logger.error(f"LLM not found for agent {config.name}: {config.llm_name}")
                 return None
             
-            # Get tools
-            tools = []
-            for tool_name in config.tools:
-                tool = self.tool_registry.get_tool(tool_name)
-                if tool:
-                    tools.append(tool)
-                else:
-                    logger.warning(f"Tool not found for agent {config.name}: {tool_name}")
+            # Get tools in one registry pass
+            found_tools = self.tool_registry.get_tools(config.tools)
+            tools = list(found_tools.values())
+            missing_tools = [tool_name for tool_name in config.tools if tool_name not in found_tools]
+            if missing_tools:
+                logger.warning(f"Tools not found for agent {config.name}: {', '.join(missing_tools)}")
             
             if not tools:
                 logger.warning(f"No tools available for agent {config.name}")
             
-            # Create system message
-            system_message = SystemMessage(content=config.system_prompt)
-            
-            # Create prompt
-            prompt = ChatPromptTemplate.from_messages(
-                [
-                    system_message,
-                    MessagesPlaceholder(variable_name="chat_history"),
-                    ("user", "{input}"),
-                    MessagesPlaceholder(variable_name="agent_scratchpad"),
-                ]
-            )
+            # Get prompt (shared per system prompt)
+            prompt = _get_prompt(config.system_prompt)
             
-            # Create memory
+            # Create memory (per agent, holds its conversation)
             memory = ConversationBufferMemory(
                 memory_key="chat_history",
                 return_messages=True
@@ -175,8 +212,7 @@ class AgentRegistry:
         Returns:
             True if successful, False otherwise
         """
-        if name in self._agent_instances:
-            del self._agent_instances[name]
+        self._agent_instances.pop(name, None)
         
         return self.get_agent(name) is not None
     
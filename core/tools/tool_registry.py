@@ -118,6 +118,28 @@ class ToolRegistry:
             logger.error(f"Error creating tool instance {name}: {str(e)}")
             return None
     
+    def get_tools(self, names: List[str]) -> Dict[str, BaseTool]:
+        """
+        Get several tool instances in one pass.
+        
+        Cached instances are served straight from the instance map; only
+        names not built yet go through get_tool.
+        
+        Args:
+            names: Tool names/identifiers
+            
+        Returns:
+            Tool instances by name, in the order given; names that are not
+            found/configured are left out
+        """
+        instances = self._tool_instances
+        tools = {}
+        for name in names:
+            tool = instances.get(name) or self.get_tool(name)
+            if tool:
+                tools[name] = tool
+        return tools
+    
     def _create_tool_instance(self, config: ToolConfig) -> Optional[BaseTool]:
         """
         Create tool instance based on configuration.